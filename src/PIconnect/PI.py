@@ -8,7 +8,6 @@ from dataclasses import dataclass
 import datetime
 from typing import Dict, List, Union
 
-# pragma pylint: enable=unused-import, redefined-builtin
 from warnings import warn
 from PIconnect.AFSDK import AF
 from PIconnect.PIConsts import (
@@ -22,20 +21,25 @@ from PIconnect.PIConsts import (
 )
 from PIconnect.time import (
     timestamp_to_index,
+    to_af_time_span,
+    ticks_to_index,
     to_af_time_range,
     add_timezone,
     to_af_time,
 )
 
-from PIconnect._utils import InitialisationWarning
+from PIconnect._utils import InitialisationWarning, summary_name
 from PIconnect.AFSDK import System
 
-from collections import UserList
+from collections import OrderedDict, UserList
 
+import numpy as np
 import pandas as pd
 
 pd.options.mode.chained_assignment = None  # default='warn'
 _NOTHING = object()
+#: Number of tag searches remembered per PIServer
+_TAG_CACHE_SIZE = 1024
 
 
 def _lookup_servers() -> Dict[str, AF.PI.PIServer]:
@@ -130,6 +134,10 @@ class PIServer(object):  # pylint: disable=useless-object-inheritance
         else:
             self._credentials = None
 
+        #: Results of previous searches for exact tag names, by query and
+        #: point source, least recently used first
+        self._tag_cache = OrderedDict()
+
         if timeout:
             # System.TimeSpan(hours, minutes, seconds)
             self.connection.ConnectionInfo.OperationTimeOut = System.TimeSpan(
@@ -143,6 +151,8 @@ class PIServer(object):  # pylint: disable=useless-object-inheritance
             # Don't force to retry connecting if previous attempt failed
             force_connection = False
             self.connection.Connect(force_connection)
+        # tags may have been created or renamed since the previous connection
+        self.clear_tag_cache()
         return self
 
     def __exit__(self, *args):
@@ -174,6 +184,11 @@ class PIServer(object):  # pylint: disable=useless-object-inheritance
         Returns:
             list: A list of Tag objects as a result of the query
 
+        Results of searches for an exact tag name are cached on the server
+        object, so repeated searches for the same tag do not query the PI
+        Data Archive again. Searches with wildcards or conditions are never
+        cached. Use :meth:`clear_tag_cache` to forget the cached results.
+
         .. todo::
 
             Reject searches while not connected
@@ -188,18 +203,34 @@ class PIServer(object):  # pylint: disable=useless-object-inheritance
                 + "got type "
                 + str(type(query))
             )
-        result = TagList(
-            [
-                Tag(pi_point)
-                for pi_point in AF.PI.PIPoint.FindPIPoints(
-                    self.connection, str(query), source, None
-                )
-            ]
-        )
-        if result:
-            return result
-        else:
+        key = (query, source)
+        if key in self._tag_cache:
+            self._tag_cache.move_to_end(key)
+            # return a new list, so the cached result cannot be modified
+            return TagList(list(self._tag_cache[key]))
+
+        result = [
+            Tag(pi_point)
+            for pi_point in AF.PI.PIPoint.FindPIPoints(
+                self.connection, str(query), source, None
+            )
+        ]
+        if not result:
             raise AttributeError(f"No tags were found for query: {query}")
+        if not any(char in query for char in "*?="):
+            self._tag_cache[key] = result
+            if len(self._tag_cache) > _TAG_CACHE_SIZE:
+                self._tag_cache.popitem(last=False)
+        return TagList(list(result))
+
+    def clear_tag_cache(self):
+        """clear_tag_cache
+
+        Forget the results of previous searches by :meth:`find_tags`, e.g.
+        after tags were created or renamed on the PI Data Archive. The cache
+        is also cleared on (re)connecting.
+        """
+        self._tag_cache.clear()
 
     def tag_overview(self, query: str) -> pd.DataFrame:
         """Returns dataframe containing overview for each tag that meets the
@@ -218,7 +249,7 @@ class PIServer(object):  # pylint: disable=useless-object-inheritance
         tags = self.find_tags(str(query))
 
         df = pd.DataFrame()
-        df["Tag"] = [tag for tag in tags]
+        df["Tag"] = list(tags)
         # load attributes before GET
         # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_PI_PIPointType.htm
         attrsToGet = [
@@ -355,7 +386,7 @@ class Tag:
         Returns:
             pd.DataFrame: resulting dataframe
         """
-        AFInterval = AF.Time.AFTimeSpan.Parse(interval)
+        AFInterval = to_af_time_span(interval)
         AFTimeRange = to_af_time_range(starttime, endtime)
         filter_expression = filter_expression.replace("%tag%", self.name)
 
@@ -368,15 +399,8 @@ class Tag:
 
         if result:
             # process query results
-            data = [list(result)]
-            df = pd.DataFrame(data).T
-            df.columns = [self.name]
-            # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_Asset_AFValue.htm
-            df.index = df[df.columns[0]].apply(
-                lambda x: timestamp_to_index(x.Timestamp.UtcTime)
-            )
-            df.index.name = "Index"
-            df = df.applymap(lambda x: x.Value)
+            # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_Asset_AFValue.htm # noqa
+            df = afvalues_to_dataframe([result], [self.name])
             return df
         else:  # if no result, return empty dataframe
             return pd.DataFrame()
@@ -416,15 +440,8 @@ class Tag:
 
         if result:
             # process query results
-            data = [list(result)]
-            df = pd.DataFrame(data).T
-            df.columns = [self.name]
             # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_Asset_AFValue.htm # noqa
-            df.index = df[df.columns[0]].apply(
-                lambda x: timestamp_to_index(x.Timestamp.UtcTime)
-            )
-            df.index.name = "Index"
-            df = df.applymap(lambda x: x.Value)
+            df = afvalues_to_dataframe([result], [self.name])
         else:  # if no result, return empty dataframe
             df = pd.DataFrame()
 
@@ -458,15 +475,8 @@ class Tag:
 
         if result:
             # process query results
-            data = [list(result)]
-            df = pd.DataFrame(data).T
-            df.columns = [self.name]
             # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_Asset_AFValue.htm # noqa
-            df.index = df[df.columns[0]].apply(
-                lambda x: timestamp_to_index(x.Timestamp.UtcTime)
-            )
-            df.index.name = "Index"
-            df = df.applymap(lambda x: x.Value)
+            df = afvalues_to_dataframe([result], [self.name])
         else:
             df = pd.DataFrame()
         return df
@@ -481,18 +491,22 @@ class Tag:
             pd.DataFrame: resulting dataframe
         """
         # summary
-        df_final = pd.DataFrame()
+        summaries, values, ticks = [], [], []
         for x in result:  # per summary
-            summary = x.ToString().replace("[", "").split(",")[0]
-            value = x.Value.Value
-            timestamp = timestamp_to_index(x.Value.Timestamp.UtcTime)
-            df = pd.DataFrame(
-                [[summary, value, timestamp]],
-                columns=["Summary", "Value", "Timestamp"],
-            )
-            df_final = pd.concat([df_final, df], ignore_index=True)
+            value = x.Value
+            summaries.append(summary_name(x.Key))
+            values.append(value.Value)
+            ticks.append(value.Timestamp.UtcTime.Ticks)
+        if not summaries:
+            return pd.DataFrame()
 
-        return df_final
+        return pd.DataFrame(
+            {
+                "Summary": summaries,
+                "Value": values,
+                "Timestamp": ticks_to_index(ticks),
+            }
+        )
 
     def _parseSummariesResult(self, result) -> pd.DataFrame:
         """Parse a Summaries result and return a dataframe.
@@ -504,24 +518,21 @@ class Tag:
             pd.DataFrame: resulting dataframe
         """
         # summaries
-        df_final = pd.DataFrame()
+        summaries, values, ticks = [], [], []
         for x in result:  # per summary
-            summary = x.ToString().replace("[", "").split(",")[0]
-            values = [
-                (timestamp_to_index(value.Timestamp.UtcTime), value.Value)
-                for value in x.Value
-            ]
-            df = pd.DataFrame(values, columns=["Timestamp", "Value"])
-            df["Summary"] = summary
-            df_final = pd.concat([df_final, df], ignore_index=True)
-
-        return df_final[
-            [
-                "Summary",
-                "Value",
-                "Timestamp",
-            ]
-        ]
+            summary = summary_name(x.Key)
+            for value in x.Value:
+                summaries.append(summary)
+                values.append(value.Value)
+                ticks.append(value.Timestamp.UtcTime.Ticks)
+
+        return pd.DataFrame(
+            {
+                "Summary": summaries,
+                "Value": values,
+                "Timestamp": ticks_to_index(ticks),
+            }
+        )
 
     # CalculationBasis.EVENT_WEIGHTED avoids issues(?) with interpolation:
     # ref. #Issue 1
@@ -631,7 +642,7 @@ class Tag:
         if interval == "event":
             AFInterval = AF.Time.AFTimeSpan(AFTimeRange.Span)
         else:
-            AFInterval = AF.Time.AFTimeSpan.Parse(interval)
+            AFInterval = to_af_time_span(interval)
 
         result = self.tag.Summaries(
             AFTimeRange,
@@ -705,9 +716,9 @@ class Tag:
         if interval == "event":
             AFInterval = AF.Time.AFTimeSpan(AFTimeRange.Span)
         else:
-            AFInterval = AF.Time.AFTimeSpan.Parse(interval)
+            AFInterval = to_af_time_span(interval)
         filter_expression = filter_expression.replace("%tag%", self.name)
-        AFfilter_interval = AF.Time.AFTimeSpan.Parse(filter_interval)
+        AFfilter_interval = to_af_time_span(filter_interval)
 
         result = self.tag.FilteredSummaries(
             AFTimeRange,
@@ -826,23 +837,11 @@ class TagList(UserList):
 
         if result:
             # process query results
-            data1 = [x for x in result.GetEnumerator()]
-            PointList = [point.PIPoint for point in data1]
-            data2 = [list(series) for series in data1]
-
-            dct = {}
-            tags = [tag.Name for tag in PointList]
-            for i, lst in enumerate(data2):
-                df = pd.DataFrame([lst]).T
-                df.columns = ["Data"]
-                # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_Asset_AFValue.htm
-                df.index = df["Data"].apply(
-                    lambda x: timestamp_to_index(x.Timestamp.UtcTime)
-                )
-                df.index.name = "Index"
-                df = df.applymap(lambda x: x.Value)
-                dct[tags[i]] = df
-            return dct
+            # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_Asset_AFValue.htm # noqa
+            return {
+                point.PIPoint.Name: afvalues_to_dataframe([point], ["Data"])
+                for point in result.GetEnumerator()
+            }
         else:
             return dict()
 
@@ -871,7 +870,7 @@ class TagList(UserList):
                 starttime and endtime
         """
         PIPointlist = generate_pipointlist(self)
-        AFInterval = AF.Time.AFTimeSpan.Parse(interval)
+        AFInterval = to_af_time_span(interval)
         AFTimeRange = to_af_time_range(starttime, endtime)
 
         # Could have issues with quering multiple PI Data Archives simultanously, see documentation
@@ -886,20 +885,14 @@ class TagList(UserList):
 
         if result:
             # process query results
-            data1 = [x for x in result.GetEnumerator()]
+            data1 = list(result.GetEnumerator())
             PointList = [point.PIPoint for point in data1]
-            data2 = [list(series) for series in data1]
-            df = pd.DataFrame(data2).T
+            # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_Asset_AFValue.htm # noqa
+            df = afvalues_to_dataframe(data1)
             try:
                 df.columns = [tag.Name for tag in PointList]
             except:
                 df.columns = [tag.name for tag in self] #in case of filtered
-            # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_Asset_AFValue.htm # noqa
-            df.index = df[df.columns[0]].apply(
-                lambda x: timestamp_to_index(x.Timestamp.UtcTime)
-            )
-            df.index.name = "Index"
-            df = df.applymap(lambda x: x.Value)
             return df
         else:  # if no result, return empty dataframe
             return pd.DataFrame()
@@ -947,23 +940,11 @@ class TagList(UserList):
 
         if result:
             # process query results
-            data1 = [x for x in result.GetEnumerator()]
-            PointList = [point.PIPoint for point in data1]
-            data2 = [list(series) for series in data1]
-
-            dct = {}
-            tags = [tag.Name for tag in PointList]
-            for i, lst in enumerate(data2):
-                df = pd.DataFrame([lst]).T
-                df.columns = ["Data"]
-                # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_Asset_AFValue.htm # noqa
-                df.index = df["Data"].apply(
-                    lambda x: timestamp_to_index(x.Timestamp.UtcTime)
-                )
-                df.index.name = "Index"
-                df = df.applymap(lambda x: x.Value)
-                dct[tags[i]] = df
-            return dct
+            # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_Asset_AFValue.htm # noqa
+            return {
+                point.PIPoint.Name: afvalues_to_dataframe([point], ["Data"])
+                for point in result.GetEnumerator()
+            }
         else:  # if no result, return empty dictionary
             return dict()
 
@@ -1029,22 +1010,26 @@ class TagList(UserList):
         # to avoid queue emptying
         data = list(result)
         if data:
-            df_final = pd.DataFrame()
+            tags, summaries, values, ticks = [], [], [], []
             for x in data:  # per tag
-                point = [y.PIPoint.Name for y in x.Values][0]
-                summaries = [
-                    y.ToString().replace("[", "").split(",")[0] for y in x
-                ]
-                values = [
-                    [y.Value, timestamp_to_index(y.Timestamp.UtcTime)]
-                    for y in x.Values
-                ]
-                df = pd.DataFrame(values, columns=["Value", "Timestamp"])
-                df["Tag"] = point
-                df["Summary"] = summaries
-                df_final = pd.concat([df_final, df], ignore_index=True)
-
-            return df_final[["Tag", "Summary", "Value", "Timestamp"]]
+                point = None
+                for y in x:  # per summary
+                    value = y.Value
+                    if point is None:
+                        point = value.PIPoint.Name
+                    tags.append(point)
+                    summaries.append(summary_name(y.Key))
+                    values.append(value.Value)
+                    ticks.append(value.Timestamp.UtcTime.Ticks)
+
+            return pd.DataFrame(
+                {
+                    "Tag": tags,
+                    "Summary": summaries,
+                    "Value": values,
+                    "Timestamp": ticks_to_index(ticks),
+                }
+            )
         else:
             return pd.DataFrame()
 
@@ -1104,7 +1089,7 @@ class TagList(UserList):
         if interval == "event":
             AFInterval = AF.Time.AFTimeSpan(AFTimeRange.Span)
         else:
-            AFInterval = AF.Time.AFTimeSpan.Parse(interval)
+            AFInterval = to_af_time_span(interval)
 
         result = PIPointlist.Summaries(
             AFTimeRange,
@@ -1114,38 +1099,7 @@ class TagList(UserList):
             time_type,
             paging_config,
         )
-        data = list(result)
-        df_final = pd.DataFrame()
-        if data:
-            for x in data:  # per tag
-                point = [y.PIPoint.Name for y in x.Values][0]
-                summaries = [y for y in x.Keys]
-                df = pd.DataFrame(
-                    [[point, summary] for summary in summaries],
-                    columns=["Tag", "Summary"],
-                )
-                df["Timestamp"] = df["Summary"].apply(
-                    lambda key: [
-                        (
-                            timestamp_to_index(value.Timestamp.UtcTime),
-                            value.Value,
-                        )
-                        for value in x[key]
-                    ]
-                )
-                df["Summary"] = df["Summary"].replace(
-                    [y for y in x.Keys],
-                    [y.ToString().replace("[", "").split(",")[0] for y in x],
-                )
-                df = df.explode("Timestamp")
-                df[["Timestamp", "Value"]] = df["Timestamp"].apply(
-                    pd.Series
-                )  # explode list to columns
-                df_final = pd.concat([df_final, df], ignore_index=True)
-
-            df_final = df_final[["Tag", "Summary", "Value", "Timestamp"]]
-
-        return df_final
+        return summaries_to_dataframe(result)
 
     # TODO: pass to underlying Tag function
     def filtered_summaries(
@@ -1212,8 +1166,8 @@ class TagList(UserList):
         if interval == "event":
             AFInterval = AF.Time.AFTimeSpan(AFTimeRange.Span)
         else:
-            AFInterval = AF.Time.AFTimeSpan.Parse(interval)
-        AFfilter_interval = AF.Time.AFTimeSpan.Parse(filter_interval)
+            AFInterval = to_af_time_span(interval)
+        AFfilter_interval = to_af_time_span(filter_interval)
         result = PIPointlist.FilteredSummaries(
             AFTimeRange,
             AFInterval,
@@ -1226,38 +1180,7 @@ class TagList(UserList):
             paging_config,
         )
 
-        data = list(result)
-        df_final = pd.DataFrame()
-        if data:
-            for x in data:  # per tag
-                point = [y.PIPoint.Name for y in x.Values][0]
-                summaries = [y for y in x.Keys]
-                df = pd.DataFrame(
-                    [[point, summary] for summary in summaries],
-                    columns=["Tag", "Summary"],
-                )
-                df["Timestamp"] = df["Summary"].apply(
-                    lambda key: [
-                        (
-                            timestamp_to_index(value.Timestamp.UtcTime),
-                            value.Value,
-                        )
-                        for value in x[key]
-                    ]
-                )
-                df["Summary"] = df["Summary"].replace(
-                    [y for y in x.Keys],
-                    [y.ToString().replace("[", "").split(",")[0] for y in x],
-                )
-                df = df.explode("Timestamp")
-                df[["Timestamp", "Value"]] = df["Timestamp"].apply(
-                    pd.Series
-                )  # explode list to columns
-                df_final = pd.concat([df_final, df], ignore_index=True)
-
-            df_final = df_final[["Tag", "Summary", "Value", "Timestamp"]]
-
-        return df_final
+        return summaries_to_dataframe(result)
 
 
 # aux functions
@@ -1324,6 +1247,72 @@ def convert_to_TagList(
                 )
 
 
+def afvalues_to_dataframe(
+    series: List[Any], columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """Build a dataframe from one or more collections of AFValues in a single
+    pass, indexed by the timestamps of the first collection
+
+    Args:
+        series (List[Any]): collections of AFValues, one per column
+        columns (List[str], optional): column names. Defaults to None,
+            which numbers the columns.
+
+    Returns:
+        pd.DataFrame: values of each collection, indexed by timestamp
+    """
+    series = [list(values) for values in series]
+    ticks = np.fromiter(
+        (x.Timestamp.UtcTime.Ticks for x in series[0]),
+        dtype=np.int64,
+        count=len(series[0]),
+    )
+    index = ticks_to_index(ticks).rename("Index")
+    df = pd.DataFrame(
+        {i: [x.Value for x in values] for i, values in enumerate(series)},
+        index=index,
+    )
+    if columns is not None:
+        df.columns = columns
+    return df
+
+
+def summaries_to_dataframe(result) -> pd.DataFrame:
+    """Build a dataframe of summary values from the result of a (filtered)
+    summaries query, with one row per tag, summary type and timestamp
+
+    The rows are gathered in a single list and turned into a dataframe at
+    once, instead of exploding a dataframe per tag. A summary without any
+    values is kept as a single row with a NaN value and a NaT timestamp.
+    The timestamps are converted to the local timezone in one vectorised
+    call.
+
+    Args:
+        result: summaries per PIPoint, as returned by
+            `PIPointList.Summaries` or `PIPointList.FilteredSummaries`
+
+    Returns:
+        pd.DataFrame: Dataframe with columns Tag, Summary, Value and Timestamp
+    """
+    rows, ticks = [], []
+    for x in result:  # per tag
+        point = next(iter(x.Values)).PIPoint.Name
+        for summary in x:  # per summary type
+            name = summary_name(summary.Key)
+            values = list(summary.Value)
+            if not values:
+                rows.append((point, name, np.nan))
+                ticks.append(0)  # DateTime.MinValue, converted to NaT
+            for value in values:
+                rows.append((point, name, value.Value))
+                ticks.append(value.Timestamp.UtcTime.Ticks)
+    if not rows:
+        return pd.DataFrame()
+    df = pd.DataFrame(rows, columns=["Tag", "Summary", "Value"])
+    df["Timestamp"] = ticks_to_index(ticks)
+    return df
+
+
 # Can't the user can simply use iPyKernel's display func, e.g. display(df)
 def view(dataframe: pd.DataFrame) -> pd.DataFrame:
     """Return a string/float version of dataframe that can be viewed in the
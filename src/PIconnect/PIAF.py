@@ -1,15 +1,7 @@
 """ PIAF
     Core containers for connections to the PI Asset Framework.
 """
-# pragma pylint: disable=unused-import, redefined-builtin
-from __future__ import (
-    absolute_import,
-    division,
-    print_function,
-    unicode_literals,
-)
-
-from typing import Any, Dict, Optional, Union, cast, List
+from typing import Any, Dict, Optional, Tuple, Union, cast, List
 
 import pandas as pd
 import numpy as np
@@ -18,8 +10,11 @@ import numpy as np
 from PIconnect.AFSDK import System
 
 from collections import UserList
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
 
-# pragma pylint: enable=unused-import, redefined-builtin
 from warnings import warn
 
 from PIconnect.AFSDK import AF
@@ -37,7 +32,7 @@ from PIconnect.PIConsts import (
     ExpressionSampleType,
     SearchField,
 )
-from PIconnect.time import timestamp_to_index, add_timezone
+from PIconnect.time import timestamp_to_index, ticks_to_index, now_local
 from PIconnect.config import PIConfig
 from PIconnect.PI import (
     PIServer,
@@ -46,12 +41,12 @@ from PIconnect.PI import (
     convert_to_TagList,
 )
 from PIconnect._utils import InitialisationWarning
-import dataclasses
-from pytz import timezone, utc
 from datetime import datetime, timedelta
 
 
 _NOTHING = object()
+# NaT as int64 nanoseconds
+_NAT_TICKS = np.iinfo(np.int64).min
 
 
 # TODO: This appears to need some work. E.g. Validate method. i'm not
@@ -64,10 +59,10 @@ class EventList(UserList):
         # validation step---
 
     def __repr__(self):
-        return str([event for event in self.data])
+        return repr(self.data)
 
     def __str__(self):
-        return str([event for event in self.data])
+        return repr(self.data)
 
     # Methods
     def to_set(self):
@@ -89,11 +84,18 @@ class EventList(UserList):
         ]()  # empty container
 
         # option here to avoid redundancy and increase performance by checking if event is not a subevent
-        for event in self.data:
-            try:
-                afcontainer.Add(event.af_eventframe)
-            except:
-                raise ("Failed to process event {}".format(event))
+        # add all event frames in a single call, rather than one by one
+        try:
+            afcontainer.AddRange(
+                System.Array[AF.EventFrame.AFEventFrame](
+                    [event.af_eventframe for event in self.data]
+                )
+            )
+        except (AttributeError, TypeError):
+            raise TypeError(
+                "Failed to process events, EventList should only contain "
+                "Event objects"
+            )
 
         df_events = pd.DataFrame(
             columns=[
@@ -108,11 +110,6 @@ class EventList(UserList):
         )
 
         if len(afcontainer) > 0:
-            df_procedures = pd.DataFrame(
-                [(y, y.GetPath()) for y in afcontainer],
-                columns=["Event", "Path"],
-            )
-
             print(
                 "Fetching hierarchy data for {} Event(s)...".format(
                     len(afcontainer)
@@ -123,33 +120,8 @@ class EventList(UserList):
                 afcontainer, False, depth, 1000000
             )
 
-            if len(event_depth) > 0:
-                df_events = pd.DataFrame(
-                    [(y, y.GetPath()) for y in event_depth],
-                    columns=["Event", "Path"],
-                )
-
             # concatenate procedures and child event frames
-            df_events = pd.concat(
-                [df_procedures, df_events], ignore_index=True
-            )
-
-            df_events["Event"] = df_events["Event"].apply(lambda x: Event(x))
-            df_events["Name"] = df_events["Event"].apply(
-                lambda x: x.name if x else np.nan
-            )
-            df_events["Template"] = df_events["Event"].apply(
-                lambda x: x.template_name if x.af_template else np.nan
-            )
-            df_events["Level"] = (
-                df_events["Path"].str.count(r"\\").apply(lambda x: x - 4)
-            )
-            df_events["Starttime"] = df_events["Event"].apply(
-                lambda x: x.starttime if x else np.nan
-            )
-            df_events["Endtime"] = df_events["Event"].apply(
-                lambda x: x.endtime if x else np.nan
-            )
+            df_events = event_hierarchy_frame(afcontainer, event_depth)
 
         return df_events #.drop_duplicates("Path")
 
@@ -217,9 +189,7 @@ class Attribute:
     @property
     def database(self):
         """Return PIAFDatabase object"""
-        return PIAFDatabase(
-            server=self.pisystem_name, database=self.database_name
-        )
+        return PIAFDatabase.from_names(self.pisystem_name, self.database_name)
 
     @property
     def description(self):
@@ -260,7 +230,7 @@ class Attribute:
     def current_value(self):
         """Return current value for Attribute"""
         result = self.attribute.GetValue().Value
-        if type(result) == System.DateTime:
+        if isinstance(result, System.DateTime):
             result = timestamp_to_index(result)
         return result
 
@@ -305,9 +275,7 @@ class Asset:
     @property
     def database(self):
         """Return PIAFDatabase object"""
-        return PIAFDatabase(
-            server=self.pisystem_name, database=self.database_name
-        )
+        return PIAFDatabase.from_names(self.pisystem_name, self.database_name)
 
     @property
     def af_asset(self):
@@ -322,8 +290,9 @@ class Asset:
     @property
     def template_name(self):
         """Return template name"""
-        if self.asset.Template:
-            return self.asset.Template.Name
+        template = self.asset.Template
+        if template:
+            return template.Name
         else:
             return None
 
@@ -335,7 +304,7 @@ class Asset:
     @property
     def af_attributes(self):
         """'Return list of AFAttributes for Asset"""
-        return [attribute for attribute in self.asset.Attributes]
+        return list(self.asset.Attributes)
 
     @property
     def children(self):
@@ -379,18 +348,11 @@ class Asset:
             Dict[str, float]: attribute Name: attribute value
         """
         if attribute_names_list is None:
-            attribute_names_list = [
-                asset.Name for asset in self.asset.Attributes
-            ]
+            return read_attribute_values(list(self.asset.Attributes))
 
-        attribute_dct = {
-            attribute.Name: attribute.GetValue().Value
-            for attribute in self.asset.Attributes
-            if (attribute.Name in attribute_names_list)
-            or (attribute in attribute_names_list)
-        }
-
-        return attribute_dct
+        return read_attribute_values(
+            select_attributes(self.asset.Attributes, attribute_names_list)
+        )
 
     def get_events(
         self,
@@ -468,11 +430,6 @@ class Asset:
         )
 
         if len(afcontainer) > 0:
-            df_roots = pd.DataFrame(
-                [(y, y.GetPath()) for y in afcontainer],
-                columns=["Asset", "Path"],
-            )
-
             print(
                 "Fetching hierarchy data for {} Assets(s)...".format(
                     len(afcontainer)
@@ -483,28 +440,11 @@ class Asset:
                 afcontainer, False, depth, 1000000
             )
 
-            if len(asset_depth) > 0:
-                df_assets = pd.DataFrame(
-                    [(y, y.GetPath()) for y in asset_depth],
-                    columns=["Asset", "Path"],
-                )
-
-            # concatenate procedures and child assets
-            df_assets = pd.concat([df_roots, df_assets], ignore_index=True)
-
-            df_assets["Asset"] = df_assets["Asset"].apply(lambda x: Asset(x))
-            df_assets["Name"] = df_assets["Asset"].apply(
-                lambda x: x.name if x else np.nan
-            )
-            df_assets["Template"] = df_assets["Asset"].apply(
-                lambda x: x.template_name if x else np.nan
-            )
-            df_assets["Level"] = (
-                df_assets["Path"].str.count(r"\\").apply(lambda x: x - 4)
-            )
+            # concatenate roots and child assets
+            df_assets = asset_hierarchy_frame(afcontainer, asset_depth)
             # print('This Asset Frame has structure of "\\\\Server\\Database\\
-            # {}"'.format('\\'.join([str(el) for el in df_assets['Template']
-            # .unique()])))
+            # {}"'.format('\\'.join(df_assets['Template'].dropna().unique()
+            # .astype(str))))
             return df_assets
         else:
             return pd.DataFrame(
@@ -520,10 +460,10 @@ class AssetList(UserList):
         # validation step ---
 
     def __repr__(self):
-        return str([asset for asset in self.data])
+        return repr(self.data)
 
     def __str__(self):
-        return str([asset for asset in self.data])
+        return repr(self.data)
 
     def get_asset_hierarchy(self, depth: int = 10) -> pd.DataFrame:
         """Return AssetHierarchy down to the specified depth
@@ -538,22 +478,24 @@ class AssetList(UserList):
             AF.Asset.AFElement
         ]()  # empty container
 
-        for asset in self.data:
-            try:
-                afcontainer.Add(asset.af_asset)
-            except:
-                raise ("Failed to process event {}".format(asset))
+        # add all elements in a single call, rather than one by one
+        try:
+            afcontainer.AddRange(
+                System.Array[AF.Asset.AFElement](
+                    [asset.af_asset for asset in self.data]
+                )
+            )
+        except (AttributeError, TypeError):
+            raise TypeError(
+                "Failed to process assets, AssetList should only contain "
+                "Asset objects"
+            )
 
         df_assets = pd.DataFrame(
             columns=["Asset", "Path", "Name", "Template", "Level"]
         )
 
         if len(afcontainer) > 0:
-            df_roots = pd.DataFrame(
-                [(y, y.GetPath()) for y in afcontainer],
-                columns=["Asset", "Path"],
-            )
-
             print(
                 "Fetching hierarchy data for {} Assets(s)...".format(
                     len(afcontainer)
@@ -564,28 +506,11 @@ class AssetList(UserList):
                 afcontainer, False, depth, 1000000
             )
 
-            if len(asset_depth) > 0:
-                df_assets = pd.DataFrame(
-                    [(y, y.GetPath()) for y in asset_depth],
-                    columns=["Asset", "Path"],
-                )
-
-            # concatenate procedures and child assets
-            df_assets = pd.concat([df_roots, df_assets], ignore_index=True)
-
-            df_assets["Asset"] = df_assets["Asset"].apply(lambda x: Asset(x))
-            df_assets["Name"] = df_assets["Asset"].apply(
-                lambda x: x.name if x else np.nan
-            )
-            df_assets["Template"] = df_assets["Asset"].apply(
-                lambda x: x.template_name if x else np.nan
-            )
-            df_assets["Level"] = (
-                df_assets["Path"].str.count(r"\\").apply(lambda x: x - 4)
-            )
+            # concatenate roots and child assets
+            df_assets = asset_hierarchy_frame(afcontainer, asset_depth)
             # print('This Asset Frame has structure of "\\\\Server\\Database\\
-            # {}"'.format('\\'.join([str(el) for el in df_assets['Template']
-            # .unique()])))
+            # {}"'.format('\\'.join(df_assets['Template'].dropna().unique()
+            # .astype(str))))
             return df_assets
         else:
             return pd.DataFrame(
@@ -593,12 +518,10 @@ class AssetList(UserList):
             ).drop_duplicates("Path")
 
 
-try:
-    # delete the accessor to avoid warning
-    # TODO: same question as above
+# delete the accessor to avoid warning
+# TODO: same question as above
+if hasattr(pd.DataFrame, "ahy"):
     del pd.DataFrame.ahy
-except AttributeError:
-    pass
 
 
 @pd.api.extensions.register_dataframe_accessor("ahy")
@@ -629,33 +552,44 @@ class AssetHierarchy:
         """Add attribute values to AssetHierarchy for specified attributes
         defined for the specified template"""
         print("Fetching attribute(s)...")
-        if type(template_name) == int:
+        if isinstance(template_name, int):
             template_name = self.df.loc[
                 self.df["Level"] == template_name, "Template"
             ].iloc[0]
 
         if template_name == None:
-            for attribute in attribute_names_list:
-                self.df[
-                    attribute + " [" + str(template_name) + "]"
-                ] = self.df.loc[self.df["Template"].isnull(), "Asset"].apply(
-                    lambda x: lambda_aux_add_attributes(x, attribute)
-                )
+            mask = self.df["Template"].isnull()
         else:
-            for attribute in attribute_names_list:
-                self.df[
-                    attribute + " [" + str(template_name) + "]"
-                ] = self.df.loc[
-                    self.df["Template"] == template_name, "Asset"
-                ].apply(
-                    lambda x: lambda_aux_add_attributes(x, attribute)
-                )
+            mask = self.df["Template"] == template_name
+
+        # fetch the requested attributes of all assets in one bulk call,
+        # a name listed more than once is added as a single column
+        attribute_names_list = list(dict.fromkeys(attribute_names_list))
+        columns = [
+            attribute + " [" + str(template_name) + "]"
+            for attribute in attribute_names_list
+        ]
+        assets = self.df.loc[mask, "Asset"]
+        try:
+            values = bulk_attribute_values(
+                [x.asset for x in assets], attribute_names_list
+            )
+        except System.Exception as e:  # type: ignore
+            # fall back to fetching the attributes per asset, in parallel
+            warn(
+                "Reading the attributes of all assets at once failed with "
+                f"error {type(e).__qualname__}, reading them per asset"
+            )
+            values = map_events(
+                lambda x: lambda_aux_attribute_values(x, attribute_names_list),
+                assets,
+            )
+        self.df[columns] = pd.DataFrame(
+            values, index=self.df.index[mask], columns=columns
+        )
 
-        for colname in self.df.columns:
-            try:
-                self.df[colname] = self.df[colname].astype(float)
-            except:
-                pass
+        # only the added columns can hold numeric attribute values
+        cast_float_columns(self.df, columns)
         return self.df
 
     def condense(self) -> pd.DataFrame:
@@ -667,104 +601,95 @@ class AssetHierarchy:
         """
         print("Condensing...")
 
-        df = self.df.copy()
-        # merge level by level
-        for level in range(int(df["Level"].min()), int(df["Level"].max() + 1)):
-            # subdf per level
-            df_level = df[df["Level"] == level]
-            # remove empty columns
-            df_level.dropna(how="all", axis=1, inplace=True)
-            if df_level.empty:
-                df_condensed[level] = "TempValue"
-            else:
-                # add auxiliary columns for merge based on path
-                cols = [x for x in range(level + 1)]
-                df_level[cols] = (
-                    df_level["Path"].str.split("\\", expand=True).loc[:, 4:]
-                )
-                # remove Path columns
-                df_level.drop(columns=["Path"], axis=1, inplace=True)
-                # rename columns, ignore columns with number names
-                df_level.columns = [
-                    col_name + " [" + str(int(level)) + "]"
-                    if not ((type(col_name) == int) or ("[" in col_name))
-                    else col_name
-                    for col_name in df_level.columns
-                ]
-                # merge with previous level
-                if level == int(df["Level"].min()):
-                    df_condensed = df_level
-                else:
-                    df_condensed = pd.merge(
-                        df_condensed,
-                        df_level,
-                        how="outer",
-                        left_on=cols[:-1],
-                        right_on=cols[:-1],
-                    )
-        # drop auxiliary columns
-        df_condensed.drop(
-            columns=[
-                col_name
-                for col_name in df_condensed.columns
-                if type(col_name) == int
-            ],
-            axis=1,
-            inplace=True,
-        )
+        df_condensed = condense_hierarchy(self.df.drop_duplicates(subset="Path"))
         # remove duplicates
         df_condensed = df_condensed.drop_duplicates(keep="first")
 
         return df_condensed
 
 
-@dataclasses.dataclass(frozen=True)
-class PIAFServer:
-    server: AF.PISystem
-    databases: Dict[str, AF.AFDatabase] = dataclasses.field(default_factory=dict)
+class PIAFServer(Mapping):
+    """PI System with its databases, which are only enumerated on first use
+
+    Reads as a mapping with the keys "server" and "databases".
+    """
+
+    _keys = ("server", "databases")
+
+    def __init__(self, server: AF.PISystem):
+        self.server = server
+        self._databases: Optional[Dict[str, AF.AFDatabase]] = None
+
+    def __getitem__(self, key: str) -> Union[AF.PISystem, Dict[str, AF.AFDatabase]]:
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        # without looking up the databases
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
 
-    def __getitem__(self, attr: str) -> Union[AF.PISystem, Dict[str, AF.AFDatabase]]:
-        return getattr(self, attr)
+    def __len__(self) -> int:
+        return len(self._keys)
 
+    @property
+    def databases(self) -> Dict[str, AF.AFDatabase]:
+        """Return the databases on the server by name, looked up only once"""
+        if self._databases is None:
+            databases = {}
+            try:
+                for d in self.server.Databases:
+                    try:
+                        databases[d.Name] = d
+                    except (Exception, System.Exception) as e:  # type: ignore
+                        warn(
+                            f"Failed loading database data for {d.Name} on "
+                            f"{self.server.Name} with error "
+                            f"{type(cast(Exception, e)).__qualname__}",
+                            InitialisationWarning,
+                        )
+            except (Exception, System.Exception) as e:  # type: ignore
+                warn(
+                    f"Failed loading server data for {self.server.Name} "
+                    f"with error {type(cast(Exception, e)).__qualname__}",
+                    InitialisationWarning,
+                )
+            self._databases = databases
+        return self._databases
 
-ServerSpec = Dict[str, Union[AF.PISystem, Dict[str, AF.AFDatabase]]]
+
+ServerSpec = PIAFServer
 
 
 def _lookup_servers() -> Dict[str, ServerSpec]:
-    servers: Dict[str, PIAFServer] = {}
+    # only the PI Systems known to the client are listed here, the databases
+    # of a server are not enumerated until they are first needed
+    servers: Dict[str, ServerSpec] = {}
     for s in AF.PISystems():
         try:
-            servers[s.Name] = server = PIAFServer(s)
-            for d in s.Databases:
-                try:
-                    server.databases[d.Name] = d
-                except (Exception, System.Exception) as e:  # type: ignore
-                    warn(
-                        f"Failed loading database data for {d.Name} on {s.Name} "
-                        f"with error {type(cast(Exception, e)).__qualname__}",
-                        InitialisationWarning,
-                    )
+            servers[s.Name] = PIAFServer(s)
         except (Exception, System.Exception) as e:  # type: ignore
             warn(
                 f"Failed loading server data for {s.Name} "
                 f"with error {type(cast(Exception, e)).__qualname__}",
                 InitialisationWarning,
             )
-    return {
-        server_name: {
-            "server": server.server,
-            "databases": {db_name: db for db_name, db in server.databases.items()},
-        }
-        for server_name, server in servers.items()
-    }
+    return servers
 
 
-def _lookup_default_server() -> Optional[ServerSpec]:
-    servers = _lookup_servers()
-    if AF.PISystems().DefaultPISystem:
-        return servers[AF.PISystems().DefaultPISystem.Name]
+def _lookup_default_server(
+    servers: Dict[str, ServerSpec]
+) -> Optional[ServerSpec]:
+    # reuse the servers that were already looked up, enumerating all servers
+    # and their databases is expensive
+    default_server = AF.PISystems().DefaultPISystem
+    if default_server:
+        return servers[default_server.Name]
     elif len(servers) > 0:
-        return servers[list(_lookup_servers())[0]]
+        return next(iter(servers.values()))
     else:
         return None
 
@@ -777,7 +702,10 @@ class PIAFDatabase(object):
     version = "0.2.0"
 
     servers: Dict[str, ServerSpec] = _lookup_servers()
-    default_server: Optional[ServerSpec] = _lookup_default_server()
+    default_server: Optional[ServerSpec] = _lookup_default_server(servers)
+    #: Guards the creation of the databases shared by the Attribute, Asset
+    #: and Event objects, which may be used from the map_events threads
+    _databases_lock = Lock()
 
     def __init__(
         self, server: Optional[str] = None, database: Optional[str] = None
@@ -785,6 +713,22 @@ class PIAFDatabase(object):
         server_spec = self._initialise_server(server)
         self.server: AF.PISystem = server_spec["server"]  # type: ignore
         self.database: AF.AFDatabase = self._initialise_database(server_spec, database)
+        self._children: Optional[Dict[str, AF.Asset.AFElement]] = None
+        self._descendants: Dict[str, Any] = {}
+        self._templates: Dict[tuple, AF.Asset.AFElementTemplate] = {}
+
+    @classmethod
+    def from_names(cls, server: str, database: str) -> "PIAFDatabase":
+        """Return the PIAFDatabase for the named server and database, reusing
+        the instance created by an earlier call for the same names"""
+        with cls._databases_lock:
+            return cls._shared_database(server, database)
+
+    @classmethod
+    @lru_cache(maxsize=16)
+    def _shared_database(cls, server: str, database: str) -> "PIAFDatabase":
+        # only the most recently used databases are kept
+        return cls(server=server, database=database)
 
     def _initialise_server(self, server: Optional[str]) -> ServerSpec:
         if server is None:
@@ -810,7 +754,7 @@ class PIAFDatabase(object):
         if database is None:
             return default_db
 
-        databases = cast(Dict[str, AF.AFDatabase], server["databases"])
+        databases = server.databases
         if database not in databases:
             message = 'Database "{database}" not found, using the default database.'
             warn(
@@ -821,9 +765,21 @@ class PIAFDatabase(object):
         return databases[database]
 
     def __enter__(self) -> "PIAFDatabase":
-        self.server.Connect()
+        # databases are shared, so the server is often connected already
+        if not self.server.ConnectionInfo.IsConnected:
+            self.server.Connect()
+        # elements and templates may have been added or renamed since
+        self.clear_cache()
         return self
 
+    def clear_cache(self) -> None:
+        """Forget the children, descendants and templates looked up earlier,
+        e.g. after elements or templates were added or renamed. The cache is
+        also cleared on entering the database context."""
+        self._children = None
+        self._descendants.clear()
+        self._templates.clear()
+
     def __exit__(self, *args: Any) -> None:
         pass
         # Disabled disconnecting because garbage collection sometimes impedes
@@ -850,11 +806,44 @@ class PIAFDatabase(object):
     @property
     def children(self):
         """Return dictionary of the direct child elements of the database"""
-        return {c.Name: c for c in self.database.Elements}
+        if self._children is None:
+            self._children = {c.Name: c for c in self.database.Elements}
+        return self._children
 
     def descendant(self, path):
         """Return a descendant of the database from an exact path"""
-        return AF.PIAFElement(self.database.Elements.get_Item(path))
+        if path not in self._descendants:
+            element = self.database.Elements.get_Item(path)
+            if element is None:
+                # not found, so do not cache, the element may be created later
+                return AF.PIAFElement(element)
+            self._descendants[path] = AF.PIAFElement(element)
+        return self._descendants[path]
+
+    def _find_template(
+        self,
+        template_name: str,
+        sortField: SortField,
+        sortOrder: SortOrder,
+        max_count: int,
+    ) -> AF.Asset.AFElementTemplate:
+        """Return the first template matching template_name, which is only
+        looked up on the server once per database connection"""
+        key = (template_name, sortField, sortOrder, max_count)
+        if key not in self._templates:
+            templates = AF.Asset.AFElementTemplate.FindElementTemplates(
+                self.database,
+                template_name,
+                SearchField.Name,
+                sortField,
+                sortOrder,
+                max_count,
+            )
+            try:
+                self._templates[key] = list(templates)[0]
+            except IndexError:
+                raise AttributeError("Template name was not found")
+        return self._templates[key]
 
     # https://docs.osisoft.com/bundle/af-sdk/page/html/M_OSIsoft_AF_EventFrame_AFEventFrame_FindEventFrames_1.htm # noqa
     # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_AFSearchField.htm could be implemented # noqa
@@ -905,19 +894,9 @@ class PIAFDatabase(object):
             EventList: Results of events
         """
         if template_name:
-            try:
-                afsearchField = SearchField.Name
-                template = AF.Asset.AFElementTemplate.FindElementTemplates(
-                    self.database,
-                    template_name,
-                    afsearchField,
-                    sortField,
-                    sortOrder,
-                    max_count,
-                )
-                template = [x for x in template][0]
-            except:
-                raise AttributeError("Template name was not found")
+            template = self._find_template(
+                template_name, sortField, sortOrder, max_count
+            )
         else:
             template = None
 
@@ -948,6 +927,54 @@ class PIAFDatabase(object):
 
         return EventList([Event(event) for event in lst])
 
+    def iter_events(
+        self,
+        query: str = None,
+        asset: str = "*",
+        starttime: Union[str, datetime] = None,
+        endtime: Union[str, datetime] = "*",
+        template_name: str = None,
+        start_index: int = 0,
+        max_count: int = 1000000,
+        search_mode: SearchMode = SearchMode.Inclusive,
+        search_full_hierarchy: bool = True,
+        sortField: SortField = SortField.StartTime,
+        sortOrder: SortOrder = SortOrder.Ascending,
+        page_size: int = 10000,
+    ):
+        """Yield the Events that meet the query criteria one at a time,
+        searching for at most page_size events per call to the server
+
+        Takes the same arguments as :meth:`find_events`, so the first events
+        are available without waiting for the complete search.
+        """
+        if not starttime:
+            # fix the start of the search for all pages
+            starttime = AF.Time.AFTime.Now
+
+        remaining = max_count
+        while remaining > 0:
+            count = min(page_size, remaining)
+            events = self.find_events(
+                query,
+                asset,
+                starttime,
+                endtime,
+                template_name,
+                start_index,
+                count,
+                search_mode,
+                search_full_hierarchy,
+                sortField,
+                sortOrder,
+            )
+            for event in events:
+                yield event
+            if len(events) < count:
+                return
+            start_index += count
+            remaining -= count
+
     # find events by path, attribute, referenced element(done) ---------------
 
     # https://docs.osisoft.com/bundle/af-sdk/page/html/M_OSIsoft_AF_Asset_AFElement_FindElements_2.htm # noqa
@@ -998,40 +1025,56 @@ class Event:
 
     def __init__(self, event: AF.EventFrame):
         self.eventframe = event
+        self._starttime = None
+        self._endtime = None
+        self._template_name = None
+        self._ref_elements = None
+        self._af_attributes = None
+        self._top_event = None
+        self._name = None
+        self._path = None
+        self._pisystem_name = None
+        self._database_name = None
 
     def __repr__(self):
-        return "Event:" + self.eventframe.GetPath()
+        return "Event:" + self.path
 
     def __str__(self):
-        return "Event:" + self.eventframe.GetPath()
+        return "Event:" + self.path
 
     # Properties
     @property
     def name(self):
         """Return name of event"""
-        return self.eventframe.Name
+        if self._name is None:
+            self._name = self.eventframe.Name
+        return self._name
 
     @property
     def path(self):
         """Return path"""
-        return self.eventframe.GetPath()
+        if self._path is None:
+            self._path = self.eventframe.GetPath()
+        return self._path
 
     @property
     def pisystem_name(self):
         """Return PISystem name"""
-        return self.eventframe.PISystem.Name
+        if self._pisystem_name is None:
+            self._pisystem_name = self.eventframe.PISystem.Name
+        return self._pisystem_name
 
     @property
     def database_name(self):
         """Return connected database name"""
-        return self.eventframe.Database.Name
+        if self._database_name is None:
+            self._database_name = self.eventframe.Database.Name
+        return self._database_name
 
     @property
     def database(self):
         """Return PIAFDatabase object"""
-        return PIAFDatabase(
-            server=self.pisystem_name, database=self.database_name
-        )
+        return PIAFDatabase.from_names(self.pisystem_name, self.database_name)
 
     @property
     def af_eventframe(self):
@@ -1046,17 +1089,27 @@ class Event:
     @property
     def template_name(self):
         """Return template name"""
-        return self.eventframe.Template.Name
+        if self._template_name is None:
+            self._template_name = self.eventframe.Template.Name
+        return self._template_name
 
     @property
     def starttime(self):
         """Return starttime"""
-        return timestamp_to_index(self.eventframe.StartTime.UtcTime)
+        if self._starttime is None:
+            self._starttime = timestamp_to_index(self.eventframe.StartTime.UtcTime)
+        return self._starttime
 
     @property
     def endtime(self):
         """Return endtime"""
-        return timestamp_to_index(self.eventframe.EndTime.UtcTime)
+        if self._endtime is None:
+            endtime = timestamp_to_index(self.eventframe.EndTime.UtcTime)
+            # the endtime of an event in progress (NaN) can still change
+            if pd.isnull(endtime):
+                return endtime
+            self._endtime = endtime
+        return self._endtime
 
     @property
     def af_timerange(self):
@@ -1066,26 +1119,32 @@ class Event:
     @property
     def attributes(self):
         """'Return list of attribute names"""
-        return [
-            Attribute(attribute) for attribute in self.eventframe.Attributes
-        ]
+        return [Attribute(attribute) for attribute in self._attribute_list()]
 
     @property
     def af_attributes(self):
         """'Return list of AFAttributes for event"""
-        return [attribute for attribute in self.eventframe.Attributes]
+        return list(self._attribute_list())
+
+    def _attribute_list(self) -> List[AF.Asset.AFAttribute]:
+        """Return the AFAttributes of the event, enumerated only once"""
+        if self._af_attributes is None:
+            self._af_attributes = list(self.eventframe.Attributes)
+        return self._af_attributes
 
     @property
     def ref_elements(self):
         """Return list of references elements for event"""
-        return [ref_el.Name for ref_el in self.eventframe.ReferencedElements]
+        if self._ref_elements is None:
+            self._ref_elements = [
+                ref_el.Name for ref_el in self.eventframe.ReferencedElements
+            ]
+        return list(self._ref_elements)
 
     @property
     def children(self):
         """Return EventList of children"""
-        return EventList(
-            [Event(event) for event in self.eventframe.EventFrames]
-        )
+        return EventList(list(self.iter_children()))
 
     @property
     def parent(self):
@@ -1104,18 +1163,22 @@ class Event:
             return self.endtime - self.starttime
         except:  # NaT endtime
             # return timedelta.max
-            local_tz = timezone(PIConfig.DEFAULT_TIMEZONE)
-            return (
-                datetime.utcnow().replace(tzinfo=utc).astimezone(local_tz)
-                - self.starttime
-            )
+            return now_local() - self.starttime
 
     @property
     def top_event(self):
         """Return top-level event name"""
-        return self.path.strip("\\").split("\\")[2]
+        if self._top_event is None:
+            self._top_event = self.path.strip("\\").split("\\")[2]
+        return self._top_event
 
     # Methods
+    def iter_children(self):
+        """Yield the child events one at a time, without building an
+        EventList of all children first"""
+        for event in self.eventframe.EventFrames:
+            yield Event(event)
+
     def plot_values(
         self,
         tag_list: List[Union[str, Tag]],
@@ -1176,11 +1239,8 @@ class Event:
         """
         taglist = convert_to_TagList(tag_list, dataserver)
         endtime = self.endtime
-        if type(self.endtime) == float:
-            local_tz = timezone(PIConfig.DEFAULT_TIMEZONE)
-            endtime = (
-                datetime.utcnow().replace(tzinfo=utc).astimezone(local_tz)
-            )
+        if isinstance(self.endtime, float):
+            endtime = now_local()
         return taglist.interpolated_values(
             self.starttime,
             endtime,
@@ -1434,18 +1494,11 @@ class Event:
             Dict[str, float]: attribute Name: attribute value
         """
         if attribute_names_list is None:
-            attribute_names_list = [
-                att.Name for att in self.eventframe.Attributes
-            ]
+            return read_attribute_values(self._attribute_list())
 
-        attribute_dct = {
-            attribute.Name: attribute.GetValue().Value
-            for attribute in self.eventframe.Attributes
-            if (attribute.Name in attribute_names_list)
-            or (attribute in attribute_names_list)
-        }
-
-        return attribute_dct
+        return read_attribute_values(
+            select_attributes(self._attribute_list(), attribute_names_list)
+        )
 
     def get_event_hierarchy(self, depth: int = 10) -> pd.DataFrame:
         """Return EventHierarchy down to the specified depth
@@ -1456,12 +1509,6 @@ class Event:
         Returns:
             pd.DataFrame: Dataframe of event hierarchy.
         """
-        # Level better option than template names
-        df_procedures = pd.DataFrame(
-            [(self.eventframe, self.eventframe.GetPath())],
-            columns=["Event", "Path"],
-        )
-
         afcontainer = AF.AFNamedCollectionList[
             AF.EventFrame.AFEventFrame
         ]()  # empty container
@@ -1473,43 +1520,17 @@ class Event:
             afcontainer, False, depth, 1000000
         )
 
-        df_events = pd.DataFrame()
-        if len(event_depth) > 0:
-            df_events = pd.DataFrame(
-                [(y, y.GetPath()) for y in event_depth],
-                columns=["Event", "Path"],
-            )
-
         # concatenate procedures and child event frames
-        df_events = pd.concat([df_procedures, df_events], ignore_index=True)
-
-        df_events["Event"] = df_events["Event"].apply(lambda x: Event(x))
-        df_events["Name"] = df_events["Event"].apply(
-            lambda x: x.name if x else np.nan
-        )
-        df_events["Template"] = df_events["Event"].apply(
-            lambda x: x.template_name if x.af_template else np.nan
-        )
-        df_events["Level"] = (
-            df_events["Path"].str.count(r"\\").apply(lambda x: x - 4)
-        )
-        df_events["Starttime"] = df_events["Event"].apply(
-            lambda x: x.starttime if x else np.nan
-        )
-        df_events["Endtime"] = df_events["Event"].apply(
-            lambda x: x.endtime if x else np.nan
-        )
+        df_events = event_hierarchy_frame(afcontainer, event_depth)
 
         return df_events #.drop_duplicates("Path")
 
 
-try:
-    # TODO: There's an "ehy" property? Why not just change the name slightly
-    # rather than have to delete the property which could affect other modules
-    # delete the accessor to avoid warning
+# TODO: There's an "ehy" property? Why not just change the name slightly
+# rather than have to delete the property which could affect other modules
+# delete the accessor to avoid warning
+if hasattr(pd.DataFrame, "ehy"):
     del pd.DataFrame.ehy
-except AttributeError:
-    pass
 
 
 # https://pandas.pydata.org/docs/development/extending.html
@@ -1547,99 +1568,100 @@ class EventHierarchy:
         """Add attribute values to EventHierarchy for specified attributes
         defined for the specified template"""
         print("Fetching attribute(s)...")
-        if type(template_name) == int:
+        if isinstance(template_name, int):
             template_name = self.df.loc[
                 self.df["Level"] == template_name, "Template"
             ].iloc[0]
 
         if template_name == None:
-            for attribute in attribute_names_list:
-                self.df[
-                    attribute + " [" + str(template_name) + "]"
-                ] = self.df.loc[self.df["Template"].isnull(), "Event"].apply(
-                    lambda x: lambda_aux_add_attributes(x, attribute)
-                )
+            mask = self.df["Template"].isnull()
         else:
-            for attribute in attribute_names_list:
-                self.df[
-                    attribute + " [" + str(template_name) + "]"
-                ] = self.df.loc[
-                    self.df["Template"] == template_name, "Event"
-                ].apply(
-                    lambda x: lambda_aux_add_attributes(x, attribute)
-                )
+            mask = self.df["Template"] == template_name
+
+        # fetch the requested attributes of all events in one bulk call,
+        # a name listed more than once is added as a single column
+        attribute_names_list = list(dict.fromkeys(attribute_names_list))
+        columns = [
+            attribute + " [" + str(template_name) + "]"
+            for attribute in attribute_names_list
+        ]
+        events = self.df.loc[mask, "Event"]
+        try:
+            values = bulk_attribute_values(
+                [x.eventframe for x in events], attribute_names_list
+            )
+        except System.Exception as e:  # type: ignore
+            # fall back to fetching the attributes per event, in parallel
+            warn(
+                "Reading the attributes of all events at once failed with "
+                f"error {type(e).__qualname__}, reading them per event"
+            )
+            values = map_events(
+                lambda x: lambda_aux_attribute_values(x, attribute_names_list),
+                events,
+            )
+        self.df[columns] = pd.DataFrame(
+            values, index=self.df.index[mask], columns=columns
+        )
 
-        for colname in self.df.columns:
-            try:
-                self.df[colname] = self.df[colname].astype(float)
-            except:
-                pass
+        # only the added columns can hold numeric attribute values
+        cast_float_columns(self.df, columns)
         return self.df
 
     def add_ref_elements(self, template_name):
         print("Fetching referenced element(s)...")
         """Add referenced element values to EventHierarchy, defined for the
         specified template"""
-        if type(template_name) == int:
+        if isinstance(template_name, int):
             template_name = self.df.loc[
                 self.df["Level"] == template_name, "Template"
             ].iloc[0]
 
         if template_name == None:
-            ref_el = (
-                self.df.loc[self.df["Template"].isnull(), "Event"]
-                .apply(lambda x: x.ref_elements)
-                .apply(pd.Series)
-            )
+            events = self.df.loc[self.df["Template"].isnull(), "Event"]
         else:
-            ref_el = (
-                self.df.loc[self.df["Template"] == template_name, "Event"]
-                .apply(lambda x: x.ref_elements)
-                .apply(pd.Series)
-            )
+            events = self.df.loc[self.df["Template"] == template_name, "Event"]
+        # the referenced elements are fetched per event, in parallel
+        ref_el = pd.DataFrame(
+            map_events(lambda x: x.ref_elements, events), index=events.index
+        )
 
         if ref_el.empty:
             raise AttributeError("No results found for the specified template")
 
-        for col in ref_el.columns:
-            self.df[
-                "Referenced_el"
-                + " ["
-                + str(template_name)
-                + "]"
-                + "("
-                + str(col)
-                + ")"
-            ] = ref_el[col]
+        ref_el.columns = [
+            "Referenced_el" + " [" + str(template_name) + "]" + "(" + str(col) + ")"
+            for col in ref_el.columns
+        ]
+        self.df[list(ref_el.columns)] = ref_el
         return self.df
 
-    def condense(self):
-        """Condense the EventHierarchy object to return a vertically layered
-        CondensedEventHierarchy object"""
-        print("Condensing...")
-
-        df = self.df.copy()
+    @staticmethod
+    def _merge_levels(df: pd.DataFrame) -> pd.DataFrame:
+        """Condense the hierarchy by merging the events level by level on
+        their path components"""
+        # split the paths once, rather than once per level
+        path_parts = df["Path"].str.split("\\", expand=True)
 
         # merge level by level
         for level in range(int(df["Level"].min()), int(df["Level"].max() + 1)):
             # subdf per level
-            df_level = df[df["Level"] == level]
+            mask = df["Level"] == level
+            df_level = df[mask]
             # remove empty columns
             df_level.dropna(how="all", axis=1, inplace=True)
             if df_level.empty:
                 df_condensed[level] = "TempValue"
             else:
                 # add auxiliary columns for merge based on path
-                cols = [x for x in range(level + 1)]
-                df_level[cols] = (
-                    df_level["Path"].str.split("\\", expand=True).loc[:, 4:]
-                )
+                cols = list(range(level + 1))
+                df_level[cols] = path_parts.loc[mask, 4 : 4 + level]
                 # remove Path columns
                 df_level.drop(columns=["Path"], inplace=True)
                 # rename columns, ignore columns with number names
                 df_level.columns = [
                     col_name + " [" + str(int(level)) + "]"
-                    if not ((type(col_name) == int) or ("[" in col_name))
+                    if not (isinstance(col_name, int) or ("[" in col_name))
                     else col_name
                     for col_name in df_level.columns
                 ]
@@ -1659,10 +1681,24 @@ class EventHierarchy:
             columns=[
                 col_name
                 for col_name in df_condensed.columns
-                if type(col_name) == int
+                if isinstance(col_name, int)
             ],
             inplace=True,
         )
+        return df_condensed
+
+    def condense(self):
+        """Condense the EventHierarchy object to return a vertically layered
+        CondensedEventHierarchy object"""
+        print("Condensing...")
+
+        df = self.df
+        if not df["Path"].duplicated().any():
+            df_condensed = condense_hierarchy(df)
+        else:
+            # event frames may share a path, which only the merges on the
+            # path components pair with all of their children
+            df_condensed = self._merge_levels(df)
 
         # remove duplicates (issues with removing duplicates with pandas date objects)
         df_condensed = df_condensed.iloc[
@@ -1676,13 +1712,11 @@ class EventHierarchy:
             for col_name in df_condensed.columns
             if col_name.startswith("Endtime")
         ]
-        for i, col in enumerate(endtime_cols):
-            if (
-                not i == 0
-            ):  # handle naT in lower layers by inheriting from parent
-                df_condensed[col].fillna(
-                    df_condensed[endtime_cols[i - 1]], inplace=True
-                )
+        # handle naT in lower layers by inheriting from parent
+        for parent_col, col in zip(endtime_cols, endtime_cols[1:]):
+            df_condensed[col] = df_condensed[col].fillna(
+                df_condensed[parent_col]
+            )
 
         return df_condensed
 
@@ -1712,10 +1746,10 @@ class EventHierarchy:
             pd.DataFrame: Interpolated data for discrete events
         """
         print("building discrete extract table from EventHierachy...")
-        df = self.df.copy()
+        df = self.df.copy(deep=False)
 
         # performance checks
-        maxi = max(df["Event"].apply(lambda x: x.duration))
+        maxi = max_event_duration(df["Starttime"], df["Endtime"])
         if maxi > pd.Timedelta("60 days"):
             print(
                 f"Large Event(s) with duration up to {maxi} detected, "
@@ -1729,16 +1763,17 @@ class EventHierarchy:
 
         if not col:
             taglist = convert_to_TagList(tag_list, dataserver)
+            columns = ["Time"] + [tag.name for tag in taglist]
             # extract interpolated data for discrete events
-            df["Time"] = df["Event"].apply(
-                lambda x: list(
-                    x.interpolated_values(
-                        taglist,
-                        interval,
-                        filter_expression,
-                        paging_config=paging_config,
-                    ).to_records(index=True)
-                )
+            frames = map_time_ranges(
+                lambda starttime, endtime: taglist.interpolated_values(
+                    starttime,
+                    endtime,
+                    interval,
+                    filter_expression,
+                    paging_config=paging_config,
+                ).reset_index(),
+                df["Event"],
             )
 
         if col:
@@ -1747,28 +1782,28 @@ class EventHierarchy:
                     f"You can only specify a single tag column at a time"
                 )
             if tag_list[0] in df.columns:
-                event = df.columns.get_loc("Event")
-                tags = df.columns.get_loc(tag_list[0])
                 # for summary one can define multiple tags in the string
                 if df[tag_list[0]].str.contains(",").any():
                     raise AttributeError(
                         "Cell can only contain one Tag at a time"
                     )
 
+                # just single request for each unique tag
+                taglists = {
+                    tg: convert_to_TagList([tg], dataserver)
+                    for tg in df[tag_list[0]].unique()
+                }
+                columns = ["Time", "Value"]
                 # extract interpolated data for discrete events
-                df["Time"] = df.apply(
-                    lambda row: list(
-                        row[event]
-                        .interpolated_values(
-                            [row[tags]],
-                            interval,
-                            filter_expression,
-                            dataserver,
-                            paging_config=paging_config,
-                        )
-                        .to_records(index=True)
-                    ),
-                    axis=1,
+                frames = map_events(
+                    lambda event, tag: event.interpolated_values(
+                        taglists[tag],
+                        interval,
+                        filter_expression,
+                        paging_config=paging_config,
+                    ).reset_index(),
+                    df["Event"],
+                    df[tag_list[0]],
                 )
             else:
                 raise AttributeError(
@@ -1776,25 +1811,8 @@ class EventHierarchy:
                     + " is not a valid column"
                 )
 
-        df = df.explode("Time")  # explode list to rows
-        df["Time"] = df["Time"].apply(
-            lambda x: [el for el in x] if not pd.isnull(x) else np.nan
-        )  # numpy record to list
-
-        if not col:
-            df[["Time"] + [tag.name for tag in taglist]] = df["Time"].apply(
-                pd.Series
-            )  # explode list to columns
-        else:
-            df[["Time", "Value"]] = df["Time"].apply(
-                pd.Series
-            )  # explode list to columns
-        df["Time"] = df["Time"].apply(
-            lambda x: add_timezone(x) if not pd.isnull(x) else x
-        )
-        df.reset_index(drop=True, inplace=True)
-
-        return df
+        # a row per interpolated value of each event
+        return explode_event_frames(df, frames, columns)
 
     def summary_extract(
         self,
@@ -1848,10 +1866,10 @@ class EventHierarchy:
             pd.DataFrame: dataframe of summary measures
         """
         print("Building summary table from EventHierarchy...")
-        df = self.df.copy()
+        df = self.df.copy(deep=False)
 
         # performance checks
-        maxi = max(df["Event"].apply(lambda x: x.duration))
+        maxi = max_event_duration(df["Starttime"], df["Endtime"])
         if maxi > pd.Timedelta("60 days"):
             print(
                 f"Large Event(s) with duration up to {maxi} detected, "
@@ -1866,17 +1884,16 @@ class EventHierarchy:
         if not col:
             taglist = convert_to_TagList(tag_list, dataserver)
             # extract summary data for discrete events
-            df["Time"] = df["Event"].apply(
-                lambda x: list(
-                    x.summary(
-                        taglist,
-                        summary_types,
-                        dataserver,
-                        calculation_basis=calculation_basis,
-                        time_type=time_type,
-                        paging_config=paging_config,
-                    ).to_records(index=False)
-                )
+            frames = map_events(
+                lambda x: x.summary(
+                    taglist,
+                    summary_types,
+                    dataserver,
+                    calculation_basis=calculation_basis,
+                    time_type=time_type,
+                    paging_config=paging_config,
+                ),
+                df["Event"],
             )
 
         if col:
@@ -1885,33 +1902,28 @@ class EventHierarchy:
                     f"You can only specify a single tag column at a time"
                 )
             if tag_list[0] in df.columns:
-                event = df.columns.get_loc("Event")
-
                 df.reset_index(drop=True, inplace=True)
                 # just single request for each unique target
-                for tg in df[tag_list[0]].unique():
-                    tl = convert_to_TagList(
+                taglists = {
+                    tg: convert_to_TagList(
                         tg.replace(" ", "").split(","), dataserver
                     )
-                    # https://stackoverflow.com/questions/39717809/insert-list-into-cells-which-meet-column-conditions
-                    df.loc[df[tag_list[0]] == tg, "Tags"] = pd.Series(
-                        [tl] * df.shape[0]
-                    )
+                    for tg in df[tag_list[0]].unique()
+                }
+                # a new column, so the shallow copy leaves self.df untouched
+                df["Tags"] = [taglists[tg] for tg in df[tag_list[0]]]
 
                 # extract summary data for discrete events
-                df["Time"] = df.apply(
-                    lambda row: list(
-                        row[event]
-                        .summary(
-                            row["Tags"],
-                            summary_types,
-                            calculation_basis=calculation_basis,
-                            time_type=time_type,
-                            paging_config=paging_config,
-                        )
-                        .to_records(index=False)
+                frames = map_events(
+                    lambda event, taglist: event.summary(
+                        taglist,
+                        summary_types,
+                        calculation_basis=calculation_basis,
+                        time_type=time_type,
+                        paging_config=paging_config,
                     ),
-                    axis=1,
+                    df["Event"],
+                    df["Tags"],
                 )
             else:
                 raise AttributeError(
@@ -1919,16 +1931,10 @@ class EventHierarchy:
                     + "is not a valid column"
                 )
 
-        df = df.explode("Time")  # explode list to rows
-        df["Time"] = df["Time"].apply(
-            lambda x: [el for el in x] if not pd.isnull(x) else np.nan
-        )  # numpy record to list
-        df[["Tag", "Summary", "Value", "Time"]] = df["Time"].apply(
-            pd.Series
-        )  # explode list to columns
-        df.reset_index(drop=True, inplace=True)
-
-        return df
+        # a row per summary value of each event
+        return explode_event_frames(
+            df, frames, ["Tag", "Summary", "Value", "Time"]
+        )
 
     def calc_summary_extract(
         self,
@@ -1989,10 +1995,10 @@ class EventHierarchy:
             pd.DataFrame: dataframe of summary measures
         """
         print("Building calcultion summary table from EventHierarchy...")
-        df = self.df.copy()
+        df = self.df.copy(deep=False)
 
         # performance checks
-        maxi = max(df["Event"].apply(lambda x: x.duration))
+        maxi = max_event_duration(df["Starttime"], df["Endtime"])
         if maxi > pd.Timedelta("60 days"):
             print(
                 f"Large Event(s) with duration up to {maxi} detected, "
@@ -2006,47 +2012,44 @@ class EventHierarchy:
 
         if not col:
             # extract summary data for discrete events
-            df["Time"] = df["Event"].apply(
-                lambda x: list(
-                    calc_summary(
-                        starttime=x.starttime,
-                        endtime=x.endtime,
-                        interval=interval,
-                        summary_types=summary_types,
-                        expression=expression,
-                        calculation_basis=calculation_basis,
-                        time_type=time_type,
-                        AFfilter_evaluation=AFfilter_evaluation,
-                        filter_interval=filter_interval,
-                    ).to_records(index=False)
-                )
+            frames = map_events(
+                lambda x: calc_summary(
+                    starttime=x.starttime,
+                    endtime=x.endtime,
+                    interval=interval,
+                    summary_types=summary_types,
+                    expression=expression,
+                    calculation_basis=calculation_basis,
+                    time_type=time_type,
+                    AFfilter_evaluation=AFfilter_evaluation,
+                    filter_interval=filter_interval,
+                ),
+                df["Event"],
             )
 
         if col:
-            if not type(expression) == str:
+            if not isinstance(expression, str):
                 raise AttributeError(
                     "Name of expression column should be of string type"
                 )
             if expression in df.columns:
-                event = df.columns.get_loc("Event")
                 df.reset_index(drop=True, inplace=True)
 
                 # extract summary data for discrete events
-                df["Time"] = df.apply(
-                    lambda row: list(
-                        calc_summary(
-                            starttime=row[event].starttime,
-                            endtime=row[event].endtime,
-                            interval=interval,
-                            summary_types=summary_types,
-                            expression=row[expression],
-                            calculation_basis=calculation_basis,
-                            time_type=time_type,
-                            AFfilter_evaluation=AFfilter_evaluation,
-                            filter_interval=filter_interval,
-                        ).to_records(index=False)
+                frames = map_events(
+                    lambda event, expressions: calc_summary(
+                        starttime=event.starttime,
+                        endtime=event.endtime,
+                        interval=interval,
+                        summary_types=summary_types,
+                        expression=expressions,
+                        calculation_basis=calculation_basis,
+                        time_type=time_type,
+                        AFfilter_evaluation=AFfilter_evaluation,
+                        filter_interval=filter_interval,
                     ),
-                    axis=1,
+                    df["Event"],
+                    df[expression],
                 )
             else:
                 raise AttributeError(
@@ -2054,24 +2057,14 @@ class EventHierarchy:
                     + "is not a valid column name"
                 )
 
-        df = df.explode("Time")  # explode list to rows
-        df["Time"] = df["Time"].apply(
-            lambda x: [el for el in x] if not pd.isnull(x) else np.nan
-        )  # numpy record to list
-        df[["Summary", "Value", "Time"]] = df["Time"].apply(
-            pd.Series
-        )  # explode list to columns
-        df.reset_index(drop=True, inplace=True)
-
-        return df
+        # a row per summary value of each event
+        return explode_event_frames(df, frames, ["Summary", "Value", "Time"])
 
 
-try:
-    # delete the accessor to avoid warning
-    # TODO: Same as above. Why delete? what warning?
+# delete the accessor to avoid warning
+# TODO: Same as above. Why delete? what warning?
+if hasattr(pd.DataFrame, "ecd"):
     del pd.DataFrame.ecd
-except AttributeError:
-    pass
 
 
 @pd.api.extensions.register_dataframe_accessor("ecd")
@@ -2081,6 +2074,7 @@ class CondensedEventHierarchy:
 
     def __init__(self, df):
         self.df = df
+        self._bottom_columns = None
         self.validate()
 
     def validate(self):
@@ -2097,38 +2091,54 @@ class CondensedEventHierarchy:
                 "This dataframe does not have the correct EventHierarchy "
                 + "format"
             )
-        for event in self.df.columns[
+        event_columns = self.df.columns[
             self.df.columns.str.contains(r"Event\s\[.*]", regex=True)
-        ]:
-            if set(self.df[event].apply(lambda x: type(x)).unique()) == {
-                Event
-            }:
+        ]
+        for event in event_columns:
+            types = set(map(type, self.df[event].to_numpy()))
+            if types <= {Event}:  # an empty hierarchy has no events at all
                 pass
-            elif set(self.df[event].apply(lambda x: type(x)).unique()) == {
-                Event,
-                float,
-            }:
+            elif types == {Event, float}:
                 print(
                     "Attention: this CondensedHierarchy contains 'NAN' events, 'NAN' events will be dropped for the method execution"
                 )
                 # drop rows that contain NAN value in any of the Event columns
-                self.df = self.df[
-                    self.df[
-                        self.df.columns[
-                            self.df.columns.str.contains(
-                                r"Event\s\[.*]", regex=True
-                            )
-                        ]
-                    ]
-                    .notnull()
-                    .all(1)
-                ]
+                self.df = self.df[self.df[event_columns].notnull().all(1)]
             else:
                 raise AttributeError(
                     "This dataframe does not have the correct "
                     + "CondensedHierarchy format"
                 )
 
+    def _bottom_event_column(self) -> str:
+        """Return the name of the Event column on the bottom level of the
+        condensed hierarchy, looked up once for the current columns"""
+        columns = self.df.columns
+        if self._bottom_columns is None or self._bottom_columns[0] is not columns:
+            col_event = [
+                col_name for col_name in columns if col_name.startswith("Event")
+            ][-1]
+            self._bottom_columns = (columns, col_event)
+        return self._bottom_columns[1]
+
+    def _bottom_events(self, columns: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """Return the events on the bottom level of the condensed hierarchy
+        with their procedure names, followed by the specified columns
+
+        Args:
+            columns (Dict[str, str], optional): columns to include, mapped to
+                their new name. Defaults to None.
+
+        Returns:
+            pd.DataFrame: Procedure, Event and renamed columns
+        """
+        columns = columns or {}
+        df = self.df[[self._bottom_event_column()] + list(columns)].copy()
+        df.columns = ["Event"] + list(columns.values())
+        # add procedure names
+        df.insert(0, "Procedure", [x.top_event for x in df["Event"].to_numpy()])
+        return df.reset_index(drop=True)
+
     # Methods
 
     def interpol_discrete_extract(
@@ -2159,19 +2169,17 @@ class CondensedEventHierarchy:
         """
         print("building discrete extract table from condensed hierachy...")
         # select events on bottem level of condensed hierarchy
-        col_event = [
-            col_name
-            for col_name in self.df.columns
-            if col_name.startswith("Event")
-        ][-1]
+        col_event = self._bottom_event_column()
 
         # based on list of tags
         if not col:
-            df = self.df[[col_event]].copy()
-            df.columns = ["Event"]
+            df = self._bottom_events()
 
             # performance checks
-            maxi = max(df["Event"].apply(lambda x: x.duration))
+            maxi = max_event_duration(
+                self.df[col_event.replace("Event", "Starttime", 1)],
+                self.df[col_event.replace("Event", "Endtime", 1)],
+            )
             if maxi > pd.Timedelta("60 days"):
                 print(
                     f"Large Event(s) with duration up to {maxi} detected, "
@@ -2183,22 +2191,18 @@ class CondensedEventHierarchy:
                     + "Note that this might take some time..."
                 )
 
-            # add procedure names
-            df["Procedure"] = df["Event"].apply(lambda x: x.top_event)
-            df = df[["Procedure", "Event"]]
-            df.reset_index(drop=True, inplace=True)
-
             taglist = convert_to_TagList(tag_list, dataserver)
+            columns = ["Time"] + [tag.name for tag in taglist]
             # extract interpolated data for discrete events
-            df["Time"] = df["Event"].apply(
-                lambda x: list(
-                    x.interpolated_values(
-                        taglist,
-                        interval,
-                        filter_expression,
-                        paging_config=paging_config,
-                    ).to_records(index=True)
-                )
+            frames = map_time_ranges(
+                lambda starttime, endtime: taglist.interpolated_values(
+                    starttime,
+                    endtime,
+                    interval,
+                    filter_expression,
+                    paging_config=paging_config,
+                ).reset_index(),
+                df["Event"],
             )
 
         # based on column with tags
@@ -2208,8 +2212,7 @@ class CondensedEventHierarchy:
                     f"You can only specify a single tag column at a time"
                 )
             if tag_list[0] in self.df.columns:
-                df = self.df[[col_event, tag_list[0]]].copy()
-                df.columns = ["Event", "Tags"]
+                df = self._bottom_events({tag_list[0]: "Tags"})
             else:
                 raise AttributeError(
                     f"The column option was set to True, but {tag_list} is "
@@ -2217,7 +2220,10 @@ class CondensedEventHierarchy:
                 )
 
             # performance checks
-            maxi = max(df["Event"].apply(lambda x: x.duration))
+            maxi = max_event_duration(
+                self.df[col_event.replace("Event", "Starttime", 1)],
+                self.df[col_event.replace("Event", "Endtime", 1)],
+            )
             if maxi > pd.Timedelta("60 days"):
                 print(
                     f"Large Event(s) with duration up to {maxi} detected, "
@@ -2229,52 +2235,29 @@ class CondensedEventHierarchy:
                     + "Note that this might take some time..."
                 )
 
-            # add procedure names
-            df["Procedure"] = df["Event"].apply(lambda x: x.top_event)
-            df = df[["Procedure", "Event", "Tags"]]
-            df.reset_index(drop=True, inplace=True)
-
-            event = df.columns.get_loc("Event")
-            tags = df.columns.get_loc("Tags")
             if df["Tags"].str.contains(",").any():
                 raise AttributeError("Cell can only contain one Tag at a time")
 
+            # just single request for each unique tag
+            taglists = {
+                tg: convert_to_TagList([tg], dataserver)
+                for tg in df["Tags"].unique()
+            }
+            columns = ["Time", "Value"]
             # extract interpolated data for discrete events
-            df["Time"] = df.apply(
-                lambda row: list(
-                    row[event]
-                    .interpolated_values(
-                        [row[tags]],
-                        interval,
-                        filter_expression,
-                        dataserver,
-                        paging_config=paging_config,
-                    )
-                    .to_records(index=True)
-                ),
-                axis=1,
+            frames = map_events(
+                lambda event, tag: event.interpolated_values(
+                    taglists[tag],
+                    interval,
+                    filter_expression,
+                    paging_config=paging_config,
+                ).reset_index(),
+                df["Event"],
+                df["Tags"],
             )
 
-            taglist = convert_to_TagList(list(df["Tags"].unique()), dataserver)
-
-        df = df.explode("Time")  # explode list to rows
-        df["Time"] = df["Time"].apply(
-            lambda x: [el for el in x] if not pd.isnull(x) else np.nan
-        )  # numpy record to list
-        if not col:
-            df[["Time"] + [tag.name for tag in taglist]] = df["Time"].apply(
-                pd.Series
-            )  # explode list to columns
-        else:
-            df[["Time", "Value"]] = df["Time"].apply(
-                pd.Series
-            )  # explode list to columns
-        df["Time"] = df["Time"].apply(
-            lambda x: add_timezone(x) if not pd.isnull(x) else x
-        )
-        df.reset_index(drop=True, inplace=True)
-
-        return df
+        # a row per interpolated value of each event
+        return explode_event_frames(df, frames, columns)
 
     def interpol_continuous_extract(
         self,
@@ -2304,73 +2287,37 @@ class CondensedEventHierarchy:
         taglist = convert_to_TagList(tag_list, dataserver)
 
         # select events on bottem level of condensed hierarchy
-        col_start = [
-            col_name
-            for col_name in self.df.columns
-            if col_name.startswith("Starttime")
-        ][-1]
+        col_start = self._bottom_event_column().replace("Event", "Starttime", 1)
         # sort chronologically by starttime
         self.df.sort_values(by=[col_start], ascending=True, inplace=True)
 
         print("building continuous extract table from condensed hierachy...")
-        # select events on bottem level of condensed hierarchy
-        col_event = [
-            col_name
-            for col_name in self.df.columns
-            if col_name.startswith("Event")
-        ][-1]
-
-        df_base = self.df[[col_event]].copy()
-        df_base.columns = ["Event"]
-        # add procedure names
-        df_base["Procedure"] = df_base["Event"].apply(lambda x: x.top_event)
-        df_base = df_base[["Procedure", "Event"]]
-        df_base.reset_index(drop=True, inplace=True)
+        df_base = self._bottom_events()
 
         # extract interpolated data for continuous events, per procedure
-        df_cont = pd.DataFrame()
-        for proc, df_proc in df_base.groupby("Procedure"):
-            starttime = df_proc["Event"].iloc[0].starttime
-            endtime = df_proc["Event"].iloc[-1].endtime
-            values = list(
-                taglist.interpolated_values(
-                    starttime,
-                    endtime,
-                    interval,
-                    filter_expression,
-                    paging_config=paging_config,
-                ).to_records(index=True)
-            )
-            df_cont = pd.concat(
-                [
-                    df_cont,
-                    pd.DataFrame(
-                        [[proc, values]], columns=["Procedure", "Time"]
-                    ),
-                ],
-                ignore_index=True,
-            )
+        spans = procedure_spans(df_base)
+        frames = map_events(
+            lambda span: taglist.interpolated_values(
+                span[1],
+                span[2],
+                interval,
+                filter_expression,
+                paging_config=paging_config,
+            ).reset_index(),
+            spans,
+        )
+        df_cont = explode_event_frames(
+            pd.DataFrame({"Procedure": [span[0] for span in spans]}),
+            frames,
+            ["Time"] + [tag.name for tag in taglist],
+        )
 
-        df_cont = df_cont.explode("Time")  # explode list to rows
-        df_cont["Time"] = df_cont["Time"].apply(
-            lambda x: [el for el in x]
-        )  # numpy record to list
-        # pd.DataFrame(df['b'].tolist(), index=df.index) instead of
-        # apply(pd.Series) could be faster
-        df_cont[["Time"] + [tag.name for tag in taglist]] = df_cont[
-            "Time"
-        ].apply(
-            pd.Series
-        )  # explode list to columns
-        df_cont["Time"] = df_cont["Time"].apply(lambda x: add_timezone(x))
-
-        # add Event info back
-        df_cont["Event"] = np.nan
-        for event in df_base["Event"]:
-            df_cont["Event"].loc[
-                (df_cont["Time"] >= event.starttime)
-                & (df_cont["Time"] <= event.endtime)
-            ] = event
+        # add Event info back, from the events of the same procedure
+        events = group_events(df_base)
+        tagged = np.full(len(df_cont), np.nan, dtype=object)
+        for proc, rows in df_cont.groupby("Procedure").indices.items():
+            tagged[rows] = tag_events(df_cont["Time"].iloc[rows], events[proc])
+        df_cont["Event"] = tagged
 
         # format
         df_cont = df_cont[
@@ -2412,51 +2359,33 @@ class CondensedEventHierarchy:
         taglist = convert_to_TagList(tag_list, dataserver)
 
         # select events on bottem level of condensed hierarchy
-        col_start = [
-            col_name
-            for col_name in self.df.columns
-            if col_name.startswith("Starttime")
-        ][-1]
+        col_start = self._bottom_event_column().replace("Event", "Starttime", 1)
         # sort chronologically by starttime
         self.df.sort_values(by=[col_start], ascending=True, inplace=True)
 
         print("building recorded extract dict from condensed hierachy...")
-        # select events on bottem level of condensed hierarchy
-        col_event = [
-            col_name
-            for col_name in self.df.columns
-            if col_name.startswith("Event")
-        ][-1]
-
-        df_base = self.df[[col_event]].copy()
-        df_base.columns = ["Event"]
-        # add procedure names
-        df_base["Procedure"] = df_base["Event"].apply(lambda x: x.top_event)
-        df_base = df_base[["Procedure", "Event"]]
-        df_base.reset_index(drop=True, inplace=True)
+        df_base = self._bottom_events()
 
         # extract recorded data for continuous events, per procedure
-        dct = {}
-        for proc, df_proc in df_base.groupby("Procedure"):
-            starttime = df_proc["Event"].iloc[0].starttime
-            endtime = df_proc["Event"].iloc[-1].endtime
-            values = taglist.recorded_values(
-                starttime,
-                endtime,
+        spans = procedure_spans(df_base)
+        results = map_events(
+            lambda span: taglist.recorded_values(
+                span[1],
+                span[2],
                 filter_expression,
                 AFBoundaryType=AFBoundaryType,
                 paging_config=paging_config,
-            )
+            ),
+            spans,
+        )
+        events = group_events(df_base)
+        dct = {}
+        for (proc, _, _), values in zip(spans, results):
             for tag, df_rec in values.items():
-                # add Event info back
-                df_rec["Event"] = np.nan
+                # add Event info back, from the events of the same procedure
                 df_rec["Time"] = df_rec.index
-                for event in df_base["Event"]:
-                    df_rec["Event"].loc[
-                        (df_rec["Time"] >= event.starttime)
-                        & (df_rec["Time"] <= event.endtime)
-                    ] = event
-                    df_rec.reset_index(drop=True, inplace=True)
+                df_rec.reset_index(drop=True, inplace=True)
+                df_rec["Event"] = tag_events(df_rec["Time"], events[proc])
                 values[tag] = df_rec[
                     [
                         "Event",
@@ -2497,52 +2426,34 @@ class CondensedEventHierarchy:
         taglist = convert_to_TagList(tag_list, dataserver)
 
         # select events on bottem level of condensed hierarchy
-        col_start = [
-            col_name
-            for col_name in self.df.columns
-            if col_name.startswith("Starttime")
-        ][-1]
+        col_start = self._bottom_event_column().replace("Event", "Starttime", 1)
         # sort chronologically by starttime
         self.df.sort_values(by=[col_start], ascending=True, inplace=True)
 
         print(
             "building continuous plot extract dict from condensed hierachy..."
         )
-        # select events on bottem level of condensed hierarchy
-        col_event = [
-            col_name
-            for col_name in self.df.columns
-            if col_name.startswith("Event")
-        ][-1]
-
-        df_base = self.df[[col_event]].copy()
-        df_base.columns = ["Event"]
-        # add procedure names
-        df_base["Procedure"] = df_base["Event"].apply(lambda x: x.top_event)
-        df_base = df_base[["Procedure", "Event"]]
-        df_base.reset_index(drop=True, inplace=True)
+        df_base = self._bottom_events()
 
         # extract plot data for continuous events, per procedure
-        dct = {}
-        for proc, df_proc in df_base.groupby("Procedure"):
-            starttime = df_proc["Event"].iloc[0].starttime
-            endtime = df_proc["Event"].iloc[-1].endtime
-            values = taglist.plot_values(
-                starttime,
-                endtime,
+        spans = procedure_spans(df_base)
+        results = map_events(
+            lambda span: taglist.plot_values(
+                span[1],
+                span[2],
                 nr_of_intervals,
                 paging_config=paging_config,
-            )
+            ),
+            spans,
+        )
+        events = group_events(df_base)
+        dct = {}
+        for (proc, _, _), values in zip(spans, results):
             for tag, df_rec in values.items():
-                # add Event info back
-                df_rec["Event"] = np.nan
+                # add Event info back, from the events of the same procedure
                 df_rec["Time"] = df_rec.index
-                for event in df_base["Event"]:
-                    df_rec["Event"].loc[
-                        (df_rec["Time"] >= event.starttime)
-                        & (df_rec["Time"] <= event.endtime)
-                    ] = event
-                    df_rec.reset_index(drop=True, inplace=True)
+                df_rec.reset_index(drop=True, inplace=True)
+                df_rec["Event"] = tag_events(df_rec["Time"], events[proc])
                 values[tag] = df_rec[
                     [
                         "Event",
@@ -2606,17 +2517,16 @@ class CondensedEventHierarchy:
         """
 
         print("building summary table from condensed hierarchy...")
-        df = self.df.copy()
+        df = self.df
 
         # select events on bottom level of condensed hierarchy
-        col_event = [
-            col_name
-            for col_name in self.df.columns
-            if col_name.startswith("Event")
-        ][-1]
+        col_event = self._bottom_event_column()
 
         # performance checks
-        maxi = max(df[col_event].apply(lambda x: x.duration))
+        maxi = max_event_duration(
+            self.df[col_event.replace("Event", "Starttime", 1)],
+            self.df[col_event.replace("Event", "Endtime", 1)],
+        )
         if maxi > pd.Timedelta("60 days"):
             print(
                 f"Large Event(s) with duration up to {maxi} detected, "
@@ -2630,27 +2540,20 @@ class CondensedEventHierarchy:
 
         # based on list of tags
         if not col:
-            df = self.df[[col_event]].copy()
-            df.columns = ["Event"]
-
-            # add procedure names
-            df["Procedure"] = df["Event"].apply(lambda x: x.top_event)
-            df = df[["Procedure", "Event"]]
-            df.reset_index(drop=True, inplace=True)
+            df = self._bottom_events()
 
             taglist = convert_to_TagList(tag_list, dataserver)
 
             # extract summary data for discrete events
-            df["Time"] = df["Event"].apply(
-                lambda x: list(
-                    x.summary(
-                        taglist,
-                        summary_types,
-                        calculation_basis=calculation_basis,
-                        time_type=time_type,
-                        paging_config=paging_config,
-                    ).to_records(index=False)
-                )
+            frames = map_events(
+                lambda x: x.summary(
+                    taglist,
+                    summary_types,
+                    calculation_basis=calculation_basis,
+                    time_type=time_type,
+                    paging_config=paging_config,
+                ),
+                df["Event"],
             )
 
         # based on column with tags
@@ -2660,58 +2563,38 @@ class CondensedEventHierarchy:
                     f"You can only specify a single tag column at a time"
                 )
             if tag_list[0] in self.df.columns:
-                df = self.df[[col_event, tag_list[0]]].copy()
-                df.columns = ["Event", "Tags_in"]
+                df = self._bottom_events({tag_list[0]: "Tags_in"})
             else:
                 raise AttributeError(
                     f"The column option was set to True, but {tag_list} is "
                     + "not a valid column name"
                 )
 
-            # add procedure names
-            df["Procedure"] = df["Event"].apply(lambda x: x.top_event)
-            df = df[["Procedure", "Event", "Tags_in"]]
-            df.reset_index(drop=True, inplace=True)
-
             # just single request for each unique target
-            for tg in df["Tags_in"].unique():
-                tl = convert_to_TagList(
-                    tg.replace(" ", "").split(","), dataserver
-                )
-                # https://stackoverflow.com/questions/39717809/insert-list-into-cells-which-meet-column-conditions
-                df.loc[df["Tags_in"] == tg, "Tags"] = pd.Series(
-                    [tl] * df.shape[0]
-                )
+            taglists = {
+                tg: convert_to_TagList(tg.replace(" ", "").split(","), dataserver)
+                for tg in df["Tags_in"].unique()
+            }
+            df["Tags"] = [taglists[tg] for tg in df["Tags_in"]]
             df.drop(columns="Tags_in", inplace=True)
 
-            event = df.columns.get_loc("Event")
-            tags = df.columns.get_loc("Tags")
             # extract summary data for discrete events
-            df["Time"] = df.apply(
-                lambda row: list(
-                    row[event]
-                    .summary(
-                        row[tags],
-                        summary_types,
-                        calculation_basis=calculation_basis,
-                        time_type=time_type,
-                        paging_config=paging_config,
-                    )
-                    .to_records(index=False)
+            frames = map_events(
+                lambda event, taglist: event.summary(
+                    taglist,
+                    summary_types,
+                    calculation_basis=calculation_basis,
+                    time_type=time_type,
+                    paging_config=paging_config,
                 ),
-                axis=1,
+                df["Event"],
+                df["Tags"],
             )
 
-        df = df.explode("Time")  # explode list to rows
-        df["Time"] = df["Time"].apply(
-            lambda x: [el for el in x]
-        )  # numpy record to list
-        df[["Tag", "Summary", "Value", "Time"]] = df["Time"].apply(
-            pd.Series
-        )  # explode list to columns
-        df.reset_index(drop=True, inplace=True)
-
-        return df
+        # a row per summary value of each event
+        return explode_event_frames(
+            df, frames, ["Tag", "Summary", "Value", "Time"]
+        )
 
     def calc_summary_extract(
         self,
@@ -2772,17 +2655,16 @@ class CondensedEventHierarchy:
             pd.DataFrame: dataframe of summary measures
         """
         print("building calculation summary table from condensed hierarchy...")
-        df = self.df.copy()
+        df = self.df
 
         # select events on bottom level of condensed hierarchy
-        col_event = [
-            col_name
-            for col_name in self.df.columns
-            if col_name.startswith("Event")
-        ][-1]
+        col_event = self._bottom_event_column()
 
         # performance checks
-        maxi = max(df[col_event].apply(lambda x: x.duration))
+        maxi = max_event_duration(
+            self.df[col_event.replace("Event", "Starttime", 1)],
+            self.df[col_event.replace("Event", "Endtime", 1)],
+        )
         if maxi > pd.Timedelta("60 days"):
             print(
                 f"Large Event(s) with duration up to {maxi} detected, "
@@ -2795,65 +2677,47 @@ class CondensedEventHierarchy:
             )
 
         if not col:
-            df = self.df[[col_event]].copy()
-            df.columns = ["Event"]
-
-            # add procedure names
-            df["Procedure"] = df["Event"].apply(lambda x: x.top_event)
-            df = df[["Procedure", "Event"]]
-            df.reset_index(drop=True, inplace=True)
+            df = self._bottom_events()
 
             # extract summary data for discrete events
-            df["Time"] = df["Event"].apply(
-                lambda x: list(
-                    calc_summary(
-                        starttime=x.starttime,
-                        endtime=x.endtime,
-                        interval=interval,
-                        summary_types=summary_types,
-                        expression=expression,
-                        calculation_basis=calculation_basis,
-                        time_type=time_type,
-                        AFfilter_evaluation=AFfilter_evaluation,
-                        filter_interval=filter_interval,
-                    ).to_records(index=False)
-                )
+            frames = map_events(
+                lambda x: calc_summary(
+                    starttime=x.starttime,
+                    endtime=x.endtime,
+                    interval=interval,
+                    summary_types=summary_types,
+                    expression=expression,
+                    calculation_basis=calculation_basis,
+                    time_type=time_type,
+                    AFfilter_evaluation=AFfilter_evaluation,
+                    filter_interval=filter_interval,
+                ),
+                df["Event"],
             )
 
         if col:
-            if not type(expression) == str:
+            if not isinstance(expression, str):
                 raise AttributeError(
                     "Name of expression column should be of string type"
                 )
             if expression in df.columns:
-                df = self.df[[col_event, expression]].copy()
-                df.columns = ["Event", "Expression"]
-
-                df.reset_index(drop=True, inplace=True)
-
-                # add procedure names
-                df["Procedure"] = df["Event"].apply(lambda x: x.top_event)
-                df = df[["Procedure", "Event", "Expression"]]
-                df.reset_index(drop=True, inplace=True)
+                df = self._bottom_events({expression: "Expression"})
 
-                event = df.columns.get_loc("Event")
-                exp = df.columns.get_loc("Expression")
                 # extract summary data for discrete events
-                df["Time"] = df.apply(
-                    lambda row: list(
-                        calc_summary(
-                            starttime=row[event].starttime,
-                            endtime=row[event].endtime,
-                            interval=interval,
-                            summary_types=summary_types,
-                            expression=row[exp],
-                            calculation_basis=calculation_basis,
-                            time_type=time_type,
-                            AFfilter_evaluation=AFfilter_evaluation,
-                            filter_interval=filter_interval,
-                        ).to_records(index=False)
+                frames = map_events(
+                    lambda event, exp: calc_summary(
+                        starttime=event.starttime,
+                        endtime=event.endtime,
+                        interval=interval,
+                        summary_types=summary_types,
+                        expression=exp,
+                        calculation_basis=calculation_basis,
+                        time_type=time_type,
+                        AFfilter_evaluation=AFfilter_evaluation,
+                        filter_interval=filter_interval,
                     ),
-                    axis=1,
+                    df["Event"],
+                    df["Expression"],
                 )
             else:
                 raise AttributeError(
@@ -2861,23 +2725,499 @@ class CondensedEventHierarchy:
                     + "is not a valid column name"
                 )
 
-        df = df.explode("Time")  # explode list to rows
-        df["Time"] = df["Time"].apply(
-            lambda x: [el for el in x] if not pd.isnull(x) else np.nan
-        )  # numpy record to list
-        df[["Summary", "Value", "Time"]] = df["Time"].apply(
-            pd.Series
-        )  # explode list to columns
-        df.reset_index(drop=True, inplace=True)
-
-        return df
+        # a row per summary value of each event
+        return explode_event_frames(df, frames, ["Summary", "Value", "Time"])
 
 
 # aux functions
 
 
+def condense_hierarchy(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a condensed, vertically layered representation of a hierarchy
+    dataframe with a unique Path per row
+
+    Every element or event without children ends a row of the condensed
+    dataframe, with its ancestors on the same row, and the columns of each
+    level suffixed with the level. Rows are sorted by the path components
+    the level by level outer merges on the path components join on.
+
+    Args:
+        df (pd.DataFrame): hierarchy dataframe with Path and Level columns
+
+    Returns:
+        pd.DataFrame: condensed dataframe, without the Path columns
+    """
+    levels = range(int(df["Level"].min()), int(df["Level"].max() + 1))
+
+    # every row without children ends a row of the condensed table
+    parents = df["Path"].str.rsplit("\\", n=1).str[0]
+    paths = pd.Index(df["Path"])
+    parent_position = paths.get_indexer(parents)
+    row_level = df["Level"].to_numpy()
+    leaves = np.flatnonzero(~df["Path"].isin(parents))
+    leaf_level = row_level[leaves]
+
+    # walk from each leaf up to its ancestors by position, so the paths are
+    # only split once. An ancestor is only part of the row when all rows
+    # between it and the leaf are in the hierarchy as well
+    positions = np.full((len(levels), len(leaves)), -1)
+    top_level = leaf_level.copy()
+    current = leaves.copy()
+    for level in reversed(levels):
+        found = current >= 0
+        found[found] = row_level[current[found]] == level
+        positions[level - levels.start, found] = current[found]
+        top_level[found] = level
+        current[found] = parent_position[current[found]]
+
+    # order the rows by the components of their paths above the deepest
+    # level, which are the keys of the level by level outer merges, rows
+    # that end higher up the hierarchy after their cousins. Rows with the
+    # same keys keep the order of the hierarchy dataframe
+    if len(levels) > 1:
+        components = df["Path"].to_numpy()[leaves].astype(str)
+        components = pd.Series(components).str.split("\\").str[4:]
+        present = set(row_level)
+        keys = []
+        for level in range(levels.stop - 1):
+            component = components.str[level]
+            if level in levels and level not in present:
+                # the merges fill a level without rows with a placeholder
+                # for the rows that start above it
+                component[top_level < level] = "TempValue"
+            codes = pd.factorize(component, sort=True)[0]
+            keys.append(np.where(codes < 0, len(leaves), codes))
+        order = np.lexsort(keys[::-1])
+    else:
+        order = np.arange(len(leaves))
+    positions = positions[:, order]
+
+    # align the rows of each level with the leaves in a single concat,
+    # using the integer positions of the rows as keys instead of paths
+    df = df.drop(columns="Path").reset_index(drop=True)
+    frames = []
+    for level in levels:
+        df_level = df[df["Level"] == level]
+        # remove empty columns
+        df_level = df_level.dropna(how="all", axis=1)
+        df_level.columns = [
+            col_name + " [" + str(int(level)) + "]"
+            if "[" not in col_name
+            else col_name
+            for col_name in df_level.columns
+        ]
+        frames.append(
+            df_level.reindex(positions[level - levels.start]).reset_index(
+                drop=True
+            )
+        )
+    return pd.concat(frames, axis=1)
+
+
+def event_hierarchy_frame(*event_frames) -> pd.DataFrame:
+    """Return a dataframe of event hierarchy data for the AFEventFrames in
+    the passed collections, derived in a single pass over the event frames
+
+    Returns:
+        pd.DataFrame: Event, Path, Name, Template, Level, Starttime and
+            Endtime per event frame
+    """
+    rows = []
+    for collection in event_frames:
+        for y in collection:
+            # fetch each property of the AFEventFrame only once, and hand
+            # them to the Event, so it does not fetch them again later on
+            event = Event(y)
+            event._path = y.GetPath()
+            event._name = y.Name
+            template = y.Template
+            if template:
+                event._template_name = template.Name
+            rows.append(
+                (
+                    event,
+                    event._path,
+                    event._name,
+                    event._template_name if template else np.nan,
+                    y.StartTime.UtcTime.Ticks,
+                    y.EndTime.UtcTime.Ticks,
+                )
+            )
+    df_events = pd.DataFrame(
+        rows,
+        columns=["Event", "Path", "Name", "Template", "Starttime", "Endtime"],
+    )
+    df_events.insert(4, "Level", path_level(df_events["Path"]))
+    # convert start and end times together in a single vectorised call
+    times = ticks_to_index(
+        np.concatenate([df_events["Starttime"], df_events["Endtime"]])
+    )
+    df_events["Starttime"] = times[: len(df_events)]
+    df_events["Endtime"] = times[len(df_events) :]
+    return df_events
+
+
+def asset_hierarchy_frame(*elements) -> pd.DataFrame:
+    """Return a dataframe of asset hierarchy data for the AFElements in the
+    passed collections, derived in a single pass over the elements
+
+    Returns:
+        pd.DataFrame: Asset, Path, Name, Template and Level per element
+    """
+    rows = []
+    for collection in elements:
+        for y in collection:
+            # fetch each property of the AFElement only once
+            template = y.Template
+            rows.append(
+                (
+                    Asset(y),
+                    y.GetPath(),
+                    y.Name,
+                    template.Name if template else None,
+                )
+            )
+    df_assets = pd.DataFrame(
+        rows, columns=["Asset", "Path", "Name", "Template"]
+    )
+    df_assets["Level"] = path_level(df_assets["Path"])
+    return df_assets
+
+
+def path_level(paths: pd.Series) -> np.ndarray:
+    """Return the level of each AF path below its database, i.e. 0 for the
+    root elements or event frames
+
+    The separators are counted by `np.char.count` in a single vectorised
+    call, rather than with the regex based `Series.str.count`, which builds
+    a list of matches for every path.
+    """
+    return np.char.count(np.asarray(paths, dtype=str), "\\").astype(np.int64) - 4
+
+
+def explode_event_frames(
+    df: pd.DataFrame, frames: List[pd.DataFrame], columns: List[str]
+) -> pd.DataFrame:
+    """Return the rows of df repeated for each row of the dataframe that was
+    extracted for it, with the extracted values in the specified columns
+
+    The extracted dataframes are concatenated once, column by column, and
+    the rows of df are repeated by position, instead of exploding lists of
+    records per row. Rows without extracted data are kept, with NaN values.
+
+    Args:
+        df (pd.DataFrame): dataframe with a row per event
+        frames (List[pd.DataFrame]): extracted dataframe per row of df
+        columns (List[str]): names of the columns of the extracted data
+
+    Raises:
+        ValueError: If a non-empty extracted dataframe does not have as many
+            columns as specified
+
+    Returns:
+        pd.DataFrame: df joined with the extracted data
+    """
+    # columns of df keep their position, followed by Time and the others
+    new_columns = [c for c in columns if c == "Time"] + [
+        c for c in columns if c != "Time"
+    ]
+    order = list(dict.fromkeys(list(df.columns) + new_columns))
+
+    frames = list(frames)
+    for i, frame in enumerate(frames):
+        if len(frame) == 0:
+            # events without extracted data keep a single row
+            frames[i] = pd.DataFrame(columns=columns)
+        elif len(frame.columns) != len(columns):
+            raise ValueError(
+                f"Extracted data with columns {list(frame.columns)} does "
+                f"not match the expected columns {columns}"
+            )
+        else:
+            frames[i] = frame.set_axis(columns, axis=1)
+    lengths = np.array([len(frame) for frame in frames], dtype=np.int64)
+    # events without extracted data keep a single row
+    repeats = np.maximum(lengths, 1)
+    rows = np.repeat(np.arange(len(frames)), repeats)
+    # position of each row in the concatenated extract, -1 for no data
+    offsets = np.cumsum(repeats) - repeats - (np.cumsum(lengths) - lengths)
+    positions = np.arange(len(rows)) - np.repeat(offsets, repeats)
+    positions[np.repeat(lengths == 0, repeats)] = -1
+
+    if lengths.any():
+        extract = pd.concat(
+            [frame for frame in frames if len(frame)], ignore_index=True
+        )
+    else:
+        extract = pd.DataFrame(columns=columns)
+    df = df.drop(columns=[c for c in columns if c in df.columns])
+    df = pd.concat(
+        [
+            df.iloc[rows].reset_index(drop=True),
+            extract.reindex(positions).reset_index(drop=True),
+        ],
+        axis=1,
+    )
+    return df[order]
+
+
+def _datetime_ticks(times) -> np.ndarray:
+    """Return the times as int64 nanoseconds since the epoch (UTC), with NaT
+    as the smallest int64"""
+    return (
+        pd.DatetimeIndex(times).to_numpy(dtype="datetime64[ns]").view(np.int64)
+    )
+
+
+def group_events(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """Return the events of df per procedure, with their start and end times
+
+    The times are read from the events once, so the events can be matched
+    against the values of many tags by their Starttime and Endtime columns.
+
+    Args:
+        df (pd.DataFrame): dataframe with Procedure and Event columns
+
+    Returns:
+        Dict[str, pd.DataFrame]: Event, Starttime and Endtime per procedure
+    """
+    df = df.assign(
+        Starttime=[event.starttime for event in df["Event"]],
+        Endtime=[event.endtime for event in df["Event"]],
+    )
+    return dict(tuple(df.groupby("Procedure")))
+
+
+def event_positions(times, starttimes, endtimes) -> np.ndarray:
+    """Return for each of the times the position of the event during which
+    it was recorded, or -1 if there is none
+
+    A time that falls within several events gets the last of those events,
+    a time outside of all events (or NaT) gets -1. Events without an
+    endtime (in progress) match no time at all.
+
+    Args:
+        times (array-like): timestamps to look up
+        starttimes (array-like): starttimes of the events, in order of
+            increasing priority
+        endtimes (array-like): endtimes of the events
+
+    Returns:
+        np.ndarray: int64 position of the event per timestamp
+    """
+    times = _datetime_ticks(times)
+    starts = _datetime_ticks(starttimes)
+    ends = _datetime_ticks(endtimes)
+
+    if np.all(starts[1:] >= starts[:-1]) and np.all(ends[:-1] < starts[1:]):
+        # consecutive events that do not overlap (the common case): a single
+        # binary search over the starttimes finds the event of every time
+        position = np.searchsorted(starts, times, side="right") - 1
+        found = (position >= 0) & (times != _NAT_TICKS)
+        found[found] = times[found] <= ends[position[found]]
+        position[~found] = -1
+        return position
+
+    # otherwise the times are sorted once, after which the range of times
+    # of each event is found with a binary search
+    order = np.argsort(times, kind="stable")
+    sorted_times = times[order]
+    lower = np.searchsorted(sorted_times, starts, side="left")
+    upper = np.searchsorted(sorted_times, ends, side="right")
+
+    position = np.full(len(times), -1, dtype=np.int64)
+    for i, (first, last) in enumerate(zip(lower, upper)):
+        position[order[first:last]] = i
+    return position
+
+
+def tag_events(times, events: pd.DataFrame) -> np.ndarray:
+    """Return for each of the times the event during which it was recorded
+
+    The events are matched by position with :func:`event_positions`, and
+    only the matched positions are turned into Event objects at the end.
+
+    Args:
+        times (array-like): timestamps to tag
+        events (pd.DataFrame): Event, Starttime and Endtime columns, in order
+            of increasing priority
+
+    Returns:
+        np.ndarray: object array with the event (or NaN) per timestamp
+    """
+    position = event_positions(times, events["Starttime"], events["Endtime"])
+    found = position >= 0
+    tagged = np.full(len(position), np.nan, dtype=object)
+    tagged[found] = events["Event"].to_numpy()[position[found]]
+    return tagged
+
+
+def procedure_spans(df: pd.DataFrame) -> List[Tuple[str, Any, Any]]:
+    """Return the procedures of the chronologically sorted events in df, with
+    the starttime of their first and the endtime of their last event
+
+    Args:
+        df (pd.DataFrame): dataframe with Procedure and Event columns
+
+    Returns:
+        List[Tuple[str, Any, Any]]: (procedure, starttime, endtime) per
+            procedure, in order of procedure name
+    """
+    return [
+        (
+            proc,
+            df_proc["Event"].iloc[0].starttime,
+            df_proc["Event"].iloc[-1].endtime,
+        )
+        for proc, df_proc in df.groupby("Procedure")
+    ]
+
+
+def map_events(function, *items) -> list:
+    """Return the results of function for each of the items, in order
+
+    Like :func:`map`, the function takes an argument from each of the
+    passed iterables, e.g. the Event and Tags columns of a dataframe.
+    The function is evaluated in a pool of at most
+    :data:`PIConfig.MAX_PARALLEL_EVENT_QUERIES
+    <PIconnect.config.PIConfigContainer.MAX_PARALLEL_EVENT_QUERIES>` threads,
+    as the per-event AF SDK queries mostly wait for the server.
+    """
+    arguments = list(zip(*items))
+    workers = min(PIConfig.MAX_PARALLEL_EVENT_QUERIES, len(arguments))
+    if workers <= 1:
+        return [function(*args) for args in arguments]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, *zip(*arguments)))
+
+
+def map_time_ranges(function, events) -> list:
+    """Return function(starttime, endtime) for the time range of each of the
+    events, in order
+
+    Events that share a time range share a single evaluation, and the
+    distinct time ranges are evaluated in parallel with :func:`map_events`.
+    The endtime of an event in progress is passed as NaN.
+    """
+    ranges, keys = {}, []
+    for event in events:
+        starttime, endtime = event.starttime, event.endtime
+        key = (starttime, None if pd.isnull(endtime) else endtime)
+        ranges.setdefault(key, (starttime, endtime))
+        keys.append(key)
+    unique = list(ranges)
+    results = dict(
+        zip(unique, map_events(lambda key: function(*ranges[key]), unique))
+    )
+    return [results[key] for key in keys]
+
+
+def max_event_duration(starttimes: pd.Series, endtimes: pd.Series) -> pd.Timedelta:
+    """Return the longest duration of the events with the specified start and
+    end times, where events without an endtime (in progress) last until now"""
+    if starttimes.empty:
+        return pd.Timedelta(0)
+    return (endtimes.fillna(pd.Timestamp(now_local())) - starttimes).max()
+
+
+def cast_float_columns(df: pd.DataFrame, columns: List[str]) -> None:
+    """Cast the specified columns of df to float, in place
+
+    A column is only cast when all of its values convert, so text attribute
+    values are kept rather than coerced to NaN.
+    """
+    for colname in columns:
+        try:
+            df[colname] = df[colname].astype(float)
+        except (TypeError, ValueError):
+            pass
+
+
 def lambda_aux_add_attributes(x, attribute):
     try:
         return x.get_attribute_values([attribute])[attribute]
     except:
         return np.nan
+
+
+def select_attributes(
+    attributes, attribute_names_list: List[Union[str, AF.Asset.AFAttribute]]
+) -> List[AF.Asset.AFAttribute]:
+    """Return the AFAttributes that are named in, or part of, the list
+
+    Names are looked up in a set, only AFAttributes are compared. When only
+    names are requested, the scan stops as soon as all of them are found.
+    """
+    names = {a for a in attribute_names_list if isinstance(a, str)}
+    af_attributes = [a for a in attribute_names_list if not isinstance(a, str)]
+    if not names and not af_attributes:
+        return []
+    selected, found = [], 0
+    for attribute in attributes:
+        if attribute.Name in names:
+            selected.append(attribute)
+            found += 1
+            if found == len(names) and not af_attributes:
+                break
+        elif af_attributes and attribute in af_attributes:
+            selected.append(attribute)
+    return selected
+
+
+def read_attribute_values(attributes: List[AF.Asset.AFAttribute]) -> Dict[str, Any]:
+    """Return the values of the AFAttributes by name, read with a single
+    `AFAttributeList.GetValue` call instead of a call per attribute"""
+    if not attributes:
+        return {}
+    attribute_list = AF.Asset.AFAttributeList()
+    for attribute in attributes:
+        attribute_list.Add(attribute)
+    return {
+        attribute.Name: value.Value
+        for attribute, value in zip(attributes, attribute_list.GetValue())
+    }
+
+
+def bulk_attribute_values(af_objects, attribute_names_list) -> List[list]:
+    """Return the values of the specified attributes for each AFElement or
+    AFEventFrame, fetched with a single call to the server
+
+    The attributes are gathered in an AFAttributeList, of which the values
+    are read with one bulk `GetValue` call, instead of a `GetValue` call
+    per attribute.
+
+    Returns:
+        List[list]: attribute values per AF object, in the order of
+            `attribute_names_list`. Missing attributes are NaN.
+    """
+    # a name that is listed more than once fills each of its columns
+    columns: Dict[str, List[int]] = {}
+    for j, name in enumerate(attribute_names_list):
+        columns.setdefault(name, []).append(j)
+    attribute_list = AF.Asset.AFAttributeList()
+    positions = []
+    for i, af_object in enumerate(af_objects):
+        for attribute in af_object.Attributes:
+            js = columns.get(attribute.Name)
+            if js is not None:
+                attribute_list.Add(attribute)
+                positions.append((i, js))
+
+    values = [[np.nan] * len(attribute_names_list) for _ in af_objects]
+    if positions:
+        for (i, js), value in zip(positions, attribute_list.GetValue()):
+            for j in js:
+                values[i][j] = value.Value
+    return values
+
+
+def lambda_aux_attribute_values(x, attribute_names_list):
+    try:
+        values = x.get_attribute_values(attribute_names_list)
+    except:
+        # fall back to fetching the attributes one by one
+        return [
+            lambda_aux_add_attributes(x, attribute)
+            for attribute in attribute_names_list
+        ]
+    return [values.get(attribute, np.nan) for attribute in attribute_names_list]
@@ -1,2 +1,19 @@
+from functools import lru_cache
+
+from PIconnect.PIConsts import SummaryType
+
+
 class InitialisationWarning(UserWarning):
-    pass
\ No newline at end of file
+    pass
+
+
+@lru_cache(maxsize=64)
+def summary_name(key) -> str:
+    """Return the name of an AFSummaryTypes key of a summary result
+
+    Depending on the version of pythonnet the key is either an integer or an
+    enum object.
+    """
+    if isinstance(key, int):
+        return SummaryType(key).name
+    return key.ToString()
@@ -3,12 +3,12 @@
 """
 from typing import Union
 import datetime
-from pytz import timezone
-from PIconnect.config import PIConfig
 
 from PIconnect.AFSDK import AF
 from PIconnect.time import (
-    timestamp_to_index,
+    now_local,
+    ticks_to_index,
+    to_af_time_span,
     to_af_time_range,
 )
 from PIconnect.PIConsts import (
@@ -17,6 +17,8 @@ from PIconnect.PIConsts import (
     TimestampCalculation,
     ExpressionSampleType,
 )
+from PIconnect.PI import afvalues_to_dataframe
+from PIconnect._utils import summary_name
 
 import pandas as pd
 
@@ -37,15 +39,8 @@ def calc_recorded(
 
     if result:
         # process query results
-        data = [list(result)]
-        df = pd.DataFrame(data).T
-        df.columns = ["calculation"]
         # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_Asset_AFValue.htm # noqa
-        df.index = df[df.columns[0]].apply(
-            lambda x: timestamp_to_index(x.Timestamp.UtcTime)
-        )
-        df.index.name = "Index"
-        df = df.applymap(lambda x: x.Value)
+        df = afvalues_to_dataframe([result], ["calculation"])
     else:  # if no result, return empty dataframe
         df = pd.DataFrame()
 
@@ -63,22 +58,15 @@ def calc_interpolated(
 
     Expression arguments need to be entered as raw strings: r'expression'"""
     afrange = to_af_time_range(starttime, endtime)
-    afinterval = AF.Time.AFTimeSpan.Parse(interval)
+    afinterval = to_af_time_span(interval)
     result = AF.Data.AFCalculation.CalculateAtIntervals(
         0, expression, afrange, afinterval
     )
 
     if result:
         # process query results
-        data = [list(result)]
-        df = pd.DataFrame(data).T
-        df.columns = ["calculation"]
         # https://docs.osisoft.com/bundle/af-sdk/page/html/T_OSIsoft_AF_Asset_AFValue.htm # noqa
-        df.index = df[df.columns[0]].apply(
-            lambda x: timestamp_to_index(x.Timestamp.UtcTime)
-        )
-        df.index.name = "Index"
-        df = df.applymap(lambda x: x.Value)
+        df = afvalues_to_dataframe([result], ["calculation"])
     else:  # if no result, return empty dataframe
         df = pd.DataFrame()
 
@@ -145,8 +133,8 @@ def calc_summary(
     if interval == 'event':
         AFInterval = AF.Time.AFTimeSpan(AFTimeRange.Span)
     else:
-        AFInterval = AF.Time.AFTimeSpan.Parse(interval)
-    AFfilter_interval = AF.Time.AFTimeSpan.Parse(filter_interval)
+        AFInterval = to_af_time_span(interval)
+    AFfilter_interval = to_af_time_span(filter_interval)
 
     try:
         result = AF.Data.AFCalculation.CalculateSummaries(
@@ -162,31 +150,26 @@ def calc_summary(
         )
     except AF.PI.PIException as e:
         if str(e).startswith("[-11091]"):
-            if type(endtime) == float:
-                endtime = timezone(PIConfig.DEFAULT_TIMEZONE).localize(
-                    datetime.datetime.now()
-                )
+            if isinstance(endtime, float):
+                endtime = now_local()
             raise AttributeError(
                 f"Duration of '{starttime - endtime}' exceeds the maximum allowed collection limit, please exclude event or reduce query duration"
             )
         else:
             raise AttributeError(e)
 
-    df_final = pd.DataFrame()
+    summaries, values, ticks = [], [], []
     for x in result:  # per summary
-        summary = x.ToString().replace("[", "").split(",")[0]
-        values = [
-            (timestamp_to_index(value.Timestamp.UtcTime), value.Value)
-            for value in x.Value
-        ]
-        df = pd.DataFrame(values, columns=["Timestamp", "Value"])
-        df["Summary"] = summary
-        df_final = pd.concat([df_final, df], ignore_index=True)
-
-    return df_final[
-        [
-            "Summary",
-            "Value",
-            "Timestamp",
-        ]
-    ]
+        summary = summary_name(x.Key)
+        for value in x.Value:
+            summaries.append(summary)
+            values.append(value.Value)
+            ticks.append(value.Timestamp.UtcTime.Ticks)
+
+    return pd.DataFrame(
+        {
+            "Summary": summaries,
+            "Value": values,
+            "Timestamp": ticks_to_index(ticks),
+        }
+    )
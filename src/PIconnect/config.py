@@ -1,6 +1,7 @@
 from tzlocal import get_localzone_name
 class PIConfigContainer:
     _default_timezone = get_localzone_name()
+    _max_parallel_event_queries = 8
 
     @property
     def DEFAULT_TIMEZONE(self):
@@ -16,5 +17,17 @@ class PIConfigContainer:
             )
         self._default_timezone = value
 
+    @property
+    def MAX_PARALLEL_EVENT_QUERIES(self):
+        return self._max_parallel_event_queries
+
+    @MAX_PARALLEL_EVENT_QUERIES.setter
+    def MAX_PARALLEL_EVENT_QUERIES(self, value):
+        if not isinstance(value, int) or value < 1:
+            raise ValueError(
+                "{v!r} is not a positive number of queries".format(v=value)
+            )
+        self._max_parallel_event_queries = value
+
 
 PIConfig = PIConfigContainer()
@@ -150,7 +150,7 @@ def threading(
     for thread in thread_list:
         thread.join()
 
-    if type(queue[0]) == pd.DataFrame:
+    if isinstance(queue[0], pd.DataFrame):
 
         # for summaries
         if queue[0].index.dtype == np.int64:
@@ -160,5 +160,5 @@ def threading(
             return queue
 
     # for recorded/plot dicts
-    elif type(queue[0]) == dict:
+    elif isinstance(queue[0], dict):
         return {k: v for d in queue for k, v in d.items()}
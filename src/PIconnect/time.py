@@ -1,12 +1,38 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Union
 import numpy as np
+import pandas as pd
 import pytz
 
 from PIconnect.AFSDK import AF
 from PIconnect.config import PIConfig
 from PIconnect.AFSDK import System
 
+# .NET ticks (100 ns intervals since 0001-01-01) at the unix epoch
+_EPOCH_TICKS = 621355968000000000
+_TICKS_PER_MS = 10000
+# range of milliseconds since the epoch representable as datetime64[ns]
+_MIN_MS = pd.Timestamp.min.value // 1000000 + 1
+_MAX_MS = pd.Timestamp.max.value // 1000000
+
+
+@lru_cache(maxsize=8)
+def _timezone(name: str) -> pytz.BaseTzInfo:
+    """Return the pytz timezone with the specified name, built only once"""
+    return pytz.timezone(name)
+
+
+def now_local() -> datetime:
+    """Return the current time in the local timezone.
+
+    Returns:
+        `datetime`: Current time with the timezone info from
+        :data:`PIConfig.DEFAULT_TIMEZONE
+        <PIconnect.config.PIConfigContainer.DEFAULT_TIMEZONE>`.
+    """
+    return datetime.now(tz=_timezone(PIConfig.DEFAULT_TIMEZONE))
+
 
 def to_af_time_range(
     start_time: Union[str, datetime],
@@ -34,13 +60,7 @@ def to_af_time_range(
     if isinstance(end_time, datetime):
         end_time = end_time.isoformat()
     if isinstance(end_time, float):
-        local_tz = pytz.timezone(PIConfig.DEFAULT_TIMEZONE)
-        end_time = (
-            datetime.utcnow()
-            .replace(tzinfo=pytz.utc)
-            .astimezone(local_tz)
-            .isoformat()
-        )
+        end_time = now_local().isoformat()
 
     return AF.Time.AFTimeRange(start_time, end_time)
 
@@ -63,6 +83,23 @@ def to_af_time(time: Union[str, datetime]) -> AF.Time.AFTime:
     return AF.Time.AFTime(time)
 
 
+@lru_cache(maxsize=128)
+def to_af_time_span(interval: str) -> AF.Time.AFTimeSpan:
+    """Convert an interval string to a AFTimeSpan value.
+
+    Parsed intervals are cached, as the same few intervals are used for
+    most queries.
+
+    Args:
+        interval (str): Interval to convert to AFTimeSpan, e.g. "1h".
+
+    Returns:
+        :afsdk:`AF.Time.AFTimeSpan <T_OSIsoft_AF_Time_AFTimeSpan.htm>`:
+            Time span of the interval.
+    """
+    return AF.Time.AFTimeSpan.Parse(interval)
+
+
 def timestamp_to_index(timestamp: System.DateTime):
     """Convert System.DateTime to datetime in local timezone.
 
@@ -89,7 +126,7 @@ def timestamp_to_index(timestamp: System.DateTime):
             return np.nan
 
         else:
-            local_tz = pytz.timezone(PIConfig.DEFAULT_TIMEZONE)
+            local_tz = _timezone(PIConfig.DEFAULT_TIMEZONE)
             return (
                 datetime(
                     timestamp.Year,
@@ -107,6 +144,49 @@ def timestamp_to_index(timestamp: System.DateTime):
         return np.nan
 
 
+def ticks_to_index(ticks) -> pd.DatetimeIndex:
+    """Convert an array of .NET ticks in UTC to a datetime index in local
+    timezone.
+
+    Vectorised counterpart of :func:`timestamp_to_index`: timestamps are
+    truncated to milliseconds, and timestamps that do not fit a
+    `datetime64[ns]` (e.g. infinite endtimes) are returned as NaT.
+
+    Args:
+        ticks (array-like): `System.DateTime.Ticks` values of UTC timestamps
+
+    Returns:
+        pd.DatetimeIndex: Datetimes with the timezone info from
+        :data:`PIConfig.DEFAULT_TIMEZONE
+        <PIconnect.config.PIConfigContainer.DEFAULT_TIMEZONE>`.
+    """
+    ms = (np.asarray(ticks, dtype=np.int64) - _EPOCH_TICKS) // _TICKS_PER_MS
+    valid = (ms >= _MIN_MS) & (ms <= _MAX_MS)
+    ns = np.where(valid, ms, 0) * 1000000
+    ns[~valid] = np.iinfo(np.int64).min  # NaT
+    return (
+        pd.DatetimeIndex(ns.view("datetime64[ns]"))
+        .tz_localize("UTC")
+        .tz_convert(PIConfig.DEFAULT_TIMEZONE)
+    )
+
+
 def add_timezone(timestamp):
-    local_tz = pytz.timezone(PIConfig.DEFAULT_TIMEZONE)
+    """Convert UTC timestamp(s) to the local timezone.
+
+    A `pd.Series` or `pd.DatetimeIndex` is converted in a single vectorised
+    call: naive timestamps are taken to be in UTC, timezone aware timestamps
+    are converted as they are. A single timestamp is taken to be in UTC.
+    """
+    if isinstance(timestamp, pd.Series):
+        return pd.Series(
+            add_timezone(pd.DatetimeIndex(timestamp)),
+            index=timestamp.index,
+            name=timestamp.name,
+        )
+    if isinstance(timestamp, pd.DatetimeIndex):
+        if timestamp.tz is None:
+            timestamp = timestamp.tz_localize("UTC")
+        return timestamp.tz_convert(PIConfig.DEFAULT_TIMEZONE)
+    local_tz = _timezone(PIConfig.DEFAULT_TIMEZONE)
     return timestamp.replace(tzinfo=pytz.utc).astimezone(local_tz)
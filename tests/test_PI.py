@@ -3,6 +3,8 @@
 import PIconnect
 import datetime
 import pandas as pd
+from types import SimpleNamespace
+from PIconnect.PI import afvalues_to_dataframe, summaries_to_dataframe
 from PIconnect.PIConsts import SummaryType
 
 def test_connection():
@@ -264,3 +266,94 @@ def test_taglist(af_connect, pi_timerange):
         )
         == 24.01
     ), "minimum value should be 24.01"
+
+
+class _FakeAFValue:
+    """AFValue with a value, a UTC timestamp and the name of its PIPoint"""
+
+    def __init__(self, value, timestamp, point="SINUSOID"):
+        delta = timestamp - datetime.datetime(1, 1, 1)
+        ticks = delta // datetime.timedelta(microseconds=1) * 10
+        self.Value = value
+        self.Timestamp = SimpleNamespace(UtcTime=SimpleNamespace(Ticks=ticks))
+        self.PIPoint = SimpleNamespace(Name=point)
+
+
+class _FakeSummaryKey:
+    """AFSummaryTypes key, as returned by pythonnet 3"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def ToString(self):
+        return self.name
+
+
+class _FakeSummaries:
+    """AFValues per summary type name, iterated as key value pairs like the
+    summaries of a PIPoint"""
+
+    def __init__(self, summaries):
+        self.summaries = summaries
+        self.Values = [v for values in summaries.values() for v in values]
+
+    def __iter__(self):
+        return iter(
+            SimpleNamespace(Key=_FakeSummaryKey(name), Value=values)
+            for name, values in self.summaries.items()
+        )
+
+
+def test_afvalues_to_dataframe(monkeypatch):
+    """Test building a dataframe from AFValues, without a PI server"""
+    monkeypatch.setattr(PIconnect.PIConfig, "DEFAULT_TIMEZONE", "Europe/Brussels")
+    times = [datetime.datetime(2022, 1, 1), datetime.datetime(2022, 1, 2)]
+    df = afvalues_to_dataframe(
+        [
+            [_FakeAFValue(1.0, t) for t in times],
+            [_FakeAFValue("On", t) for t in times],
+        ],
+        ["SINUSOID", "STATE"],
+    )
+    assert list(df.columns) == ["SINUSOID", "STATE"]
+    assert list(df["SINUSOID"]) == [1.0, 1.0]
+    assert list(df["STATE"]) == ["On", "On"]
+    assert df.index.name == "Index"
+    assert list(df.index) == [
+        pd.Timestamp(t, tz="UTC").tz_convert("Europe/Brussels") for t in times
+    ]
+
+    empty = afvalues_to_dataframe([[]], ["SINUSOID"])
+    assert empty.empty
+    assert str(empty.index.tz) == "Europe/Brussels"
+
+
+def test_summaries_to_dataframe(monkeypatch):
+    """Test building a dataframe from summaries, without a PI server"""
+    monkeypatch.setattr(PIconnect.PIConfig, "DEFAULT_TIMEZONE", "Europe/Brussels")
+    time = datetime.datetime(2022, 1, 1)
+    result = [
+        _FakeSummaries(
+            {
+                "Minimum": [_FakeAFValue(1.0, time)],
+                "Maximum": [_FakeAFValue(2.0, time)],
+            }
+        ),
+        _FakeSummaries(
+            {
+                "Minimum": [_FakeAFValue(3.0, time, "SINUSOIDU")],
+                "Maximum": [],
+            }
+        ),
+    ]
+    df = summaries_to_dataframe(result)
+    assert list(df.columns) == ["Tag", "Summary", "Value", "Timestamp"]
+    assert list(df["Tag"]) == ["SINUSOID", "SINUSOID", "SINUSOIDU", "SINUSOIDU"]
+    assert list(df["Summary"]) == ["Minimum", "Maximum", "Minimum", "Maximum"]
+    assert df["Value"].iloc[:3].tolist() == [1.0, 2.0, 3.0]
+    # a summary without values is kept, with NaN and NaT
+    assert pd.isna(df["Value"].iloc[3])
+    assert pd.isna(df["Timestamp"].iloc[3])
+    assert df["Timestamp"].iloc[0] == pd.Timestamp(time, tz="UTC")
+
+    assert summaries_to_dataframe([]).empty
@@ -2,7 +2,10 @@
 
 import PIconnect
 import datetime
+import random
+import numpy as np
 import pandas as pd
+from types import SimpleNamespace
 from PIconnect.PIConsts import SummaryType, CalculationBasis
 
 def test_connection():
@@ -420,3 +423,253 @@ def test_condensed(af_connect, af_timerange):
         col=False,
     )
     assert len(calc_summary_values) == (len(condensed) * 2)
+
+
+def _asset_hierarchy(paths):
+    """Return an AssetHierarchy dataframe for the asset paths, in order"""
+    return pd.DataFrame(
+        {
+            "Asset": paths,
+            "Path": paths,
+            "Name": [path.split("\\")[-1] for path in paths],
+            "Template": ["T" + str(path.count("\\") - 4) for path in paths],
+            "Level": [path.count("\\") - 4 for path in paths],
+        }
+    )
+
+
+def test_condense_complete_tree():
+    """Test the rows and row order of a condensed, complete asset tree"""
+    root = "\\\\server\\database\\"
+    df = _asset_hierarchy(
+        [
+            root + "Z",
+            root + "Z\\b",
+            root + "Z\\a",
+            root + "Z\\a\\x",
+            root + "A",
+            root + "A\\c",
+        ]
+    )
+    condensed = PIconnect.PIAF.AssetHierarchy(df).condense()
+    assert list(condensed.columns) == [
+        name + " [" + str(level) + "]"
+        for level in range(3)
+        for name in ["Asset", "Name", "Template", "Level"]
+    ]
+    expected = pd.DataFrame(
+        {
+            "Name [0]": ["A", "Z", "Z"],
+            "Name [1]": ["c", "a", "b"],
+            "Name [2]": [None, "x", None],
+        }
+    )
+    pd.testing.assert_frame_equal(
+        condensed[expected.columns].reset_index(drop=True),
+        expected,
+        check_dtype=False,
+    )
+
+
+def test_condense_missing_level():
+    """Test the row order of a condensed asset tree with missing parents, as
+    joining the levels one by one on their paths orders them"""
+    root = "\\\\server\\database\\"
+    df = _asset_hierarchy(
+        [
+            root + "Z",
+            root + "Z\\a\\x",
+            root + "A",
+            root + "A\\c",
+            root + "A\\c\\y",
+            root + "M\\n",
+        ]
+    )
+    condensed = PIconnect.PIAF.AssetHierarchy(df).condense()
+    expected = pd.DataFrame(
+        {
+            "Name [0]": ["A", None, None, "Z"],
+            "Name [1]": ["c", "n", None, None],
+            "Name [2]": ["y", None, "x", None],
+        }
+    )
+    pd.testing.assert_frame_equal(
+        condensed[expected.columns].reset_index(drop=True),
+        expected,
+        check_dtype=False,
+    )
+
+
+def _tag_events_by_mask(times, events):
+    """Tag the times with a boolean mask per event, as the extracts used to"""
+    tagged = pd.Series(np.nan, index=times.index, dtype=object)
+    for event in events:
+        if pd.isna(event.endtime):
+            continue  # in progress, no time compares within a NaN endtime
+        tagged.loc[(times >= event.starttime) & (times <= event.endtime)] = event
+    return tagged
+
+
+def _random_events(rng, base):
+    """Return chronologically sorted events, which overlap when requested"""
+    events = []
+    overlap = rng.random() < 0.4
+    hours = 0
+    for _ in range(rng.randint(0, 8)):
+        if overlap:
+            start = rng.randint(0, 100)
+            duration = rng.randint(0, 30)
+        else:
+            hours += rng.randint(0, 10)
+            start, duration = hours, rng.randint(0, 8)
+            hours += duration + 1
+        starttime = base + datetime.timedelta(hours=start)
+        endtime = (
+            np.nan  # in progress
+            if rng.random() < 0.15
+            else starttime + datetime.timedelta(hours=duration)
+        )
+        events.append(SimpleNamespace(starttime=starttime, endtime=endtime))
+    return sorted(events, key=lambda event: event.starttime)
+
+
+def test_tag_events():
+    """Test that the vectorised tagging matches a boolean mask per event,
+    for overlapping events, events without endtime and missing times"""
+    rng = random.Random(0)
+    base = pd.Timestamp("2022-03-01", tz="Europe/Brussels")
+    for _ in range(2000):
+        events = _random_events(rng, base)
+        times = pd.Series(
+            pd.date_range(base, periods=60, freq="90min")
+        ).sample(frac=1, random_state=rng.randint(0, 1000))
+        times = times.reset_index(drop=True)
+        if rng.random() < 0.3:
+            times[3] = pd.NaT
+
+        df = pd.DataFrame({"Procedure": "Procedure", "Event": events})
+        if events:
+            grouped = PIconnect.PIAF.group_events(df)["Procedure"]
+        else:
+            grouped = pd.DataFrame({"Event": [], "Starttime": [], "Endtime": []})
+        tagged = PIconnect.PIAF.tag_events(times, grouped)
+
+        expected = _tag_events_by_mask(times, events)
+        assert len(tagged) == len(expected)
+        for event, expected_event in zip(tagged, expected):
+            if pd.isna(expected_event):
+                assert pd.isna(event)
+            else:
+                assert event is expected_event
+
+
+def test_event_positions():
+    """Test the position of the event of each time"""
+    times = pd.to_datetime(
+        ["2022-01-01 01:00", "2022-01-01 02:30", "2022-01-01 05:00", None]
+    )
+    # the second event overlaps the first, the third is in progress
+    starttimes = pd.to_datetime(
+        ["2022-01-01 00:00", "2022-01-01 02:00", "2022-01-01 04:00"]
+    )
+    endtimes = pd.to_datetime(["2022-01-01 03:00", "2022-01-01 02:45", None])
+    positions = PIconnect.PIAF.event_positions(times, starttimes, endtimes)
+    assert list(positions) == [0, 1, -1, -1]
+
+    # consecutive events take the single binary search
+    endtimes = pd.to_datetime(
+        ["2022-01-01 01:00", "2022-01-01 03:00", "2022-01-01 06:00"]
+    )
+    positions = PIconnect.PIAF.event_positions(times, starttimes, endtimes)
+    assert list(positions) == [0, 1, 2, -1]
+
+
+def test_procedure_spans():
+    """Test the time span of the events of each procedure"""
+    start = pd.Timestamp("2022-01-01")
+    events = [
+        SimpleNamespace(
+            starttime=start + datetime.timedelta(hours=hour),
+            endtime=start + datetime.timedelta(hours=hour + 1),
+        )
+        for hour in range(3)
+    ]
+    df = pd.DataFrame({"Procedure": ["B", "A", "B"], "Event": events})
+    assert PIconnect.PIAF.procedure_spans(df) == [
+        ("A", events[1].starttime, events[1].endtime),
+        ("B", events[0].starttime, events[2].endtime),
+    ]
+
+
+class _FakeEventSearch:
+    """Stands in for PIAFDatabase.find_events, returning a slice of a fixed
+    list of results and recording each call"""
+
+    def __init__(self, count):
+        self.results = list(range(count))
+        self.calls = []
+
+    def __call__(self, *args):
+        start_index, max_count = args[5], args[6]
+        self.calls.append((start_index, max_count))
+        return self.results[start_index : start_index + max_count]
+
+
+def test_iter_events_pages():
+    """Test that iter_events pages through all results, also when their
+    number is a multiple of the page size"""
+    for count, expected_calls in [
+        (0, [(0, 3)]),
+        (2, [(0, 3)]),
+        (3, [(0, 3), (3, 3)]),
+        (4, [(0, 3), (3, 3)]),
+        (6, [(0, 3), (3, 3), (6, 3)]),
+    ]:
+        database = object.__new__(PIconnect.PIAFDatabase)
+        database.find_events = _FakeEventSearch(count)
+        events = list(
+            database.iter_events(starttime="*-1d", page_size=3)
+        )
+        assert events == list(range(count))
+        assert database.find_events.calls == expected_calls
+
+    # max_count bounds the last page
+    database = object.__new__(PIconnect.PIAFDatabase)
+    database.find_events = _FakeEventSearch(10)
+    events = list(
+        database.iter_events(starttime="*-1d", max_count=4, page_size=3)
+    )
+    assert events == [0, 1, 2, 3]
+    assert database.find_events.calls == [(0, 3), (3, 1)]
+
+
+def test_select_attributes():
+    """Test selecting attributes by name or AFAttribute, and that the scan
+    stops once all requested names were found"""
+    attributes = [SimpleNamespace(Name=name) for name in "abcdef"]
+    scanned = []
+
+    def scan():
+        for attribute in attributes:
+            scanned.append(attribute.Name)
+            yield attribute
+
+    selected = PIconnect.PIAF.select_attributes(scan(), ["d", "b"])
+    assert [attribute.Name for attribute in selected] == ["b", "d"]
+    assert scanned == ["a", "b", "c", "d"]
+
+    # AFAttributes are looked for in the complete collection
+    scanned.clear()
+    selected = PIconnect.PIAF.select_attributes(scan(), ["a", attributes[4]])
+    assert [attribute.Name for attribute in selected] == ["a", "e"]
+    assert scanned == list("abcdef")
+
+    # missing names do not stop the scan early
+    scanned.clear()
+    selected = PIconnect.PIAF.select_attributes(scan(), ["z", "c"])
+    assert [attribute.Name for attribute in selected] == ["c"]
+    assert scanned == list("abcdef")
+
+    assert PIconnect.PIAF.select_attributes(scan(), []) == []
+    # nothing selected, nothing read from the server
+    assert PIconnect.PIAF.read_attribute_values([]) == {}
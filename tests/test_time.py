@@ -0,0 +1,67 @@
+"""Unit Tests for time.py Module"""
+
+import datetime
+import numpy as np
+import pandas as pd
+import pytest
+
+import PIconnect
+from PIconnect.time import ticks_to_index
+
+
+def _ticks(timestamp: datetime.datetime) -> int:
+    """Return the .NET ticks of a naive UTC datetime"""
+    delta = timestamp - datetime.datetime(1, 1, 1)
+    return delta // datetime.timedelta(microseconds=1) * 10
+
+
+@pytest.fixture
+def brussels(monkeypatch):
+    """Use Europe/Brussels as the default timezone"""
+    monkeypatch.setattr(PIconnect.PIConfig, "DEFAULT_TIMEZONE", "Europe/Brussels")
+
+
+def test_ticks_to_index_timezone(brussels):
+    """Test that UTC ticks are localised to the default timezone"""
+    index = ticks_to_index(
+        [
+            _ticks(datetime.datetime(2022, 1, 1, 12)),
+            _ticks(datetime.datetime(2022, 7, 1, 12)),
+        ]
+    )
+    assert isinstance(index, pd.DatetimeIndex)
+    assert str(index.tz) == "Europe/Brussels"
+    assert index[0] == pd.Timestamp("2022-01-01 13:00", tz="Europe/Brussels")
+    assert index[1] == pd.Timestamp("2022-07-01 14:00", tz="Europe/Brussels")
+
+
+def test_ticks_to_index_truncates_to_milliseconds(brussels):
+    """Test that timestamps are truncated to milliseconds"""
+    ticks = _ticks(datetime.datetime(2022, 1, 1)) + 1234567  # 123.4567 ms
+    index = ticks_to_index([ticks])
+    assert index[0] == pd.Timestamp(
+        "2022-01-01 00:00:00.123", tz="UTC"
+    ).tz_convert("Europe/Brussels")
+
+
+def test_ticks_to_index_out_of_range(brussels):
+    """Test that ticks outside of the datetime64[ns] range become NaT"""
+    index = ticks_to_index(
+        [
+            0,  # DateTime.MinValue
+            _ticks(datetime.datetime(9999, 12, 31, 23, 59, 59)),
+            _ticks(datetime.datetime(2022, 1, 1)),
+        ]
+    )
+    assert pd.isna(index[0])
+    assert pd.isna(index[1])
+    assert index[2] == pd.Timestamp("2022-01-01", tz="UTC")
+
+
+def test_ticks_to_index_empty(brussels):
+    """Test that no ticks give an empty index in the default timezone"""
+    for ticks in ([], np.array([], dtype=np.int64)):
+        index = ticks_to_index(ticks)
+        assert isinstance(index, pd.DatetimeIndex)
+        assert len(index) == 0
+        assert str(index.tz) == "Europe/Brussels"